@@ -149,8 +149,8 @@ Examples:
                 # Override config with command line arguments
                 config = _apply_cli_overrides(config, args)
 
-                converter = PDFToMarkdownConverter(config)
-                converter.convert_directory("documents")
+                with PDFToMarkdownConverter(config) as converter:
+                    converter.convert_directory("documents")
                 return
             else:
                 print("No PDF files found in 'documents/' directory.")
@@ -176,7 +176,6 @@ Examples:
     # Override config with command line arguments
     config = _apply_cli_overrides(config, args)
 
-    converter = PDFToMarkdownConverter(config)
     input_path = Path(args.input)
 
     if input_path.is_file() and input_path.suffix.lower() == '.pdf':
@@ -188,10 +187,12 @@ Examples:
             md_json_dir = out_dir / "md-json"
             md_json_dir.mkdir(parents=True, exist_ok=True)
             output_path = md_json_dir / input_path.with_suffix('.md').name
-        converter.convert_pdf_to_markdown(input_path, output_path)
+        with PDFToMarkdownConverter(config) as converter:
+            converter.convert_pdf_to_markdown(input_path, output_path)
     elif input_path.is_dir():
         # Convert all PDFs in directory
-        converter.convert_directory(input_path)
+        with PDFToMarkdownConverter(config) as converter:
+            converter.convert_directory(input_path)
     else:
         print("Invalid input. Please provide a PDF file or directory containing PDF files.")
 
@@ -30,10 +30,12 @@ class Config:
         'ocr_language': 'eng',
         'ocr_confidence_threshold': 60,
         'detect_scanned_pages': True,
+        'ocr_workers': None,  # OCR threads per batch, None -> one per CPU
 
         # Advanced table extraction
         'table_extraction_strategies': ['bbox_analysis', 'text_alignment', 'hybrid'],
         'table_confidence_threshold': 0.7,
+        'table_early_exit_confidence': 0.9,  # skip later strategies, 0 = run all
         'extract_table_from_images': True,
 
         # Advanced image extraction
@@ -67,6 +69,9 @@ class Config:
         'image_quality': 150,
         'show_progress': False,
         'parallel_processing': False,
+        'image_write_workers': 4,
+        'threading_mode': 'process',  # document tables: 'process' pool or 'none'
+        'structure_check_interval': 10,  # pages between font checks, 0 = scan all
 
         # Quality thresholds
         'min_text_extraction_ratio': 0.1,
@@ -63,6 +63,16 @@ class PDFToMarkdownConverter:
         else:
             self.hybrid_converter = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Free the OCR engines."""
+        self.ocr_extractor.close()
+
     def setup_logging(self):
         """Setup logging for conversion process."""
         # Create logs directory
@@ -465,10 +475,13 @@ class PDFToMarkdownConverter:
                     page_data['content'].append(ocr_text)
                     return page_data
 
+            # The text layout is parsed once and shared by the extractors
+            blocks = page.get_text("dict")
+
             # Enhanced image extraction with intelligent naming
             if self.config.get('extract_images', True):
                 images = self.advanced_image_extractor.extract_images_from_page(
-                    page, page_num, output_dir / "images")
+                    page, page_num, output_dir / "images", blocks)
                 page_data['images'] = images
 
                 # Create markdown references for images
@@ -487,7 +500,7 @@ class PDFToMarkdownConverter:
             # Enhanced table extraction with multiple strategies
             if self.config.get('extract_tables', True):
                 tables = self.table_extractor.extract_tables_from_page(
-                    page, page_num)
+                    page, page_num, blocks)
                 page_data['tables'] = tables
 
                 # Convert tables to markdown and add to content
@@ -512,12 +525,11 @@ class PDFToMarkdownConverter:
             # Enhanced footnote extraction
             if self.config.get('extract_footnotes', True):
                 footnotes = self.footnote_extractor.extract_footnotes_from_page(
-                    page, page_num)
+                    page, page_num, blocks)
                 page_data['footnotes'] = footnotes
 
             # Handle multi-column layout
             if self.config.get('handle_multi_column', True):
-                blocks = page.get_text("dict")
                 multi_column_text = self.text_extractor.handle_multi_column_text(
                     page, blocks)
                 if multi_column_text:
@@ -529,7 +541,6 @@ class PDFToMarkdownConverter:
 
             # Regular text extraction
             current_paragraph = []
-            blocks = page.get_text("dict")
 
             for block in blocks["blocks"]:
                 if "lines" in block:
@@ -16,6 +16,15 @@ class BaseConverter:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.setup_logging()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release resources held by the converter."""
+
     def setup_logging(self):
         """Setup logging for conversion process."""
         # Create logs directory
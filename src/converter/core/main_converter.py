@@ -2,22 +2,21 @@
 
 import fitz
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from tqdm import tqdm
 
 from ...config import Config
-from ...enricher import BibliographicEnricher
 from .base import BaseConverter
 
 # Import specialized extractors
 from ..extractors.text import TextExtractor
-from ..extractors.image import ImageExtractor, AdvancedImageExtractor
+from ..extractors.image import ImageExtractor
 from ..extractors.table import TableExtractor
 from ..extractors.link import LinkExtractor
 from ..extractors.footnote import FootnoteExtractor
-from ..extractors.ocr import OCRExtractor
 
 # Import processors
 from ..processors.metadata import MetadataProcessor
@@ -32,22 +31,52 @@ class PDFToMarkdownConverter(BaseConverter):
     def __init__(self, config: Optional[Config] = None):
         super().__init__(config)
 
+        # Thread pool for image file writes, overlapping disk I/O with
+        # parsing of the following pages
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.config.get('image_write_workers', 4))
+
         # Initialize specialized extractors
         self.text_extractor = TextExtractor(self.config)
         self.image_extractor = ImageExtractor(self.config)
-        self.advanced_image_extractor = AdvancedImageExtractor(self.config)
         self.table_extractor = TableExtractor(self.config)
         self.link_extractor = LinkExtractor(self.config)
         self.footnote_extractor = FootnoteExtractor(self.config)
-        self.ocr_extractor = OCRExtractor(self.config)
+
+        # Heavier extractors (and their optional dependencies such as
+        # pytesseract) are only imported when the feature is enabled
+        self.advanced_image_extractor = None
+        if self.config.get('extract_images', True):
+            from ..extractors.image import AdvancedImageExtractor
+            self.advanced_image_extractor = AdvancedImageExtractor(
+                self.config, io_pool=self._io_pool)
+
+        # Scanned-page detection also runs with OCR disabled, so pages are
+        # still counted; the OCR engine itself is only loaded on first use
+        self.ocr_extractor = None
+        if (self.config.get('enable_ocr', True) or
+                self.config.get('detect_scanned_pages', True)):
+            from ..extractors.ocr import OCRExtractor
+            self.ocr_extractor = OCRExtractor(self.config)
 
         # Initialize processors
         self.metadata_processor = MetadataProcessor(self.config)
         self.content_processor = ContentProcessor(self.config)
 
         # Initialize bibliographic enricher
-        self.bib_enricher = BibliographicEnricher(
-            self.config) if self.config.get('enrich_metadata', True) else None
+        self.bib_enricher = None
+        if self.config.get('enrich_metadata', True):
+            from ...enricher import BibliographicEnricher
+            self.bib_enricher = BibliographicEnricher(self.config)
+
+        # With every content extractor and the scanned-page handling
+        # disabled (e.g. bulk BibTeX runs) the per-page pipeline reduces to
+        # plain text extraction
+        self._fast_mode = not any(
+            self.config.get(key, True) for key in (
+                'extract_images', 'extract_tables', 'extract_links',
+                'extract_footnotes', 'handle_multi_column',
+                'enable_ocr', 'detect_scanned_pages'))
 
     def convert_pdf_to_markdown(self, pdf_path: str, output_path: Optional[str] = None) -> bool:
         """Convert a single PDF to Markdown with enhanced extraction."""
@@ -68,49 +97,76 @@ class PDFToMarkdownConverter(BaseConverter):
         try:
             self.logger.info(f"Starting conversion: {pdf_path}")
 
-            # Open and validate PDF
-            doc = fitz.open(pdf_path)
-
-            if doc.needs_pass:
-                self.logger.error("PDF is password protected. Cannot convert.")
-                doc.close()
-                return False
-
-            if not self._handle_corrupted_or_scanned_pdfs(doc):
-                self.logger.error("PDF appears to be scanned or corrupted.")
-                doc.close()
-                return False
-
-            # Extract document metadata
-            metadata = self._extract_document_metadata(doc)
-
-            # Analyze document structure
-            self.text_extractor.analyze_document_structure(doc)
-
-            # Perform bibliographic enrichment
-            enriched_metadata = self._perform_bibliographic_enrichment(
-                doc, metadata, output_path)
-
-            # Process document content
-            markdown_content, page_statistics = self._process_document_content(
-                doc, directories)
-
-            # Create final markdown content
-            final_content = self._create_final_content(
-                metadata, enriched_metadata, markdown_content)
-
-            # Save and report
-            success = self._save_and_report(
-                final_content, pdf_path, output_path, metadata,
-                enriched_metadata, page_statistics, doc)
-
-            doc.close()
-            return success
+            # Open and validate PDF; the context manager releases MuPDF's
+            # native resources on every exit path, including exceptions
+            with fitz.open(pdf_path) as doc:
+                if doc.needs_pass:
+                    self.logger.error(
+                        "PDF is password protected. Cannot convert.")
+                    return False
+
+                if not self._handle_corrupted_or_scanned_pdfs(doc):
+                    self.logger.error(
+                        "PDF appears to be scanned or corrupted.")
+                    return False
+
+                # Extract document metadata
+                metadata = self._extract_document_metadata(doc)
+
+                # Analyze document structure
+                self.text_extractor.analyze_document_structure(doc)
+
+                # Perform bibliographic enrichment
+                enriched_metadata = self._perform_bibliographic_enrichment(
+                    doc, metadata, output_path)
+
+                # Process document content; every deferred image write is
+                # waited for, also when page processing fails
+                failed_images = []
+                try:
+                    markdown_content, page_statistics = self._process_document_content(
+                        doc, directories)
+                finally:
+                    if self.advanced_image_extractor:
+                        failed_images = self.advanced_image_extractor.flush_pending_writes()
+
+                if failed_images:
+                    markdown_content = self._drop_failed_images(
+                        markdown_content, failed_images, page_statistics)
+
+                # Create final markdown content
+                final_content = self._create_final_content(
+                    metadata, enriched_metadata, markdown_content)
+
+                # Save and report
+                success = self._save_and_report(
+                    final_content, pdf_path, output_path, metadata,
+                    enriched_metadata, page_statistics, doc)
+
+                return success
 
         except Exception as e:
             self.logger.error(f"Error converting {pdf_path}: {str(e)}")
             return False
 
+    def close(self):
+        """Wait for pending image writes, shut down the I/O thread pool and
+        free the OCR engines."""
+        if self.advanced_image_extractor:
+            self.advanced_image_extractor.flush_pending_writes()
+        self._io_pool.shutdown(wait=True)
+        if self.ocr_extractor:
+            self.ocr_extractor.close()
+
+    def _drop_failed_images(self, markdown_content: List[str], failed_images: List[str],
+                            page_statistics: Dict[str, Any]) -> List[str]:
+        """Remove image references whose file could not be written."""
+        failed_refs = tuple(f"]({filename})" for filename in failed_images)
+        kept = [item for item in markdown_content
+                if not (item.startswith('![') and item.endswith(failed_refs))]
+        page_statistics['total_images'] -= len(markdown_content) - len(kept)
+        return kept
+
     def _extract_document_metadata(self, doc) -> Dict[str, Any]:
         """Extract document metadata."""
         if not self.config.get('extract_metadata', True):
@@ -164,6 +220,16 @@ class PDFToMarkdownConverter(BaseConverter):
             if toc:
                 markdown_content.append(toc)
 
+        # Metadata-only mode: skip the per-page extractor dispatch entirely
+        if self._fast_mode:
+            markdown_content.extend(
+                doc[page_num].get_text() for page_num in range(len(doc)))
+            return markdown_content, page_statistics
+
+        # Scanned pages are found up front and OCRed as one batch, so
+        # Tesseract works on several pages at once
+        scanned_texts = self._ocr_scanned_pages(doc)
+
         # Process pages with progress tracking
         page_iterator = range(len(doc))
         if self.config.get('show_progress', False):
@@ -174,7 +240,9 @@ class PDFToMarkdownConverter(BaseConverter):
             self.logger.debug(f"Processing page {page_num + 1}/{len(doc)}")
 
             # Process page with all extractors
-            page_data = self._process_page(page, page_num, directories['base'])
+            page_data = self._process_page(
+                page, page_num, directories['base'],
+                scanned_texts.get(page_num))
 
             # Accumulate statistics
             page_statistics['total_images'] += len(page_data.get('images', []))
@@ -193,8 +261,43 @@ class PDFToMarkdownConverter(BaseConverter):
 
         return markdown_content, page_statistics
 
-    def _process_page(self, page, page_num: int, output_dir: Path) -> Dict[str, Any]:
-        """Process a single page with all extractors."""
+    def _ocr_scanned_pages(self, doc) -> Dict[int, str]:
+        """Find the scanned pages of a document and OCR them in one batch.
+
+        Returns the OCR text of every scanned page by page number; it is
+        empty when OCR is disabled or recognised nothing.
+        """
+        if not self.ocr_extractor:
+            return {}
+
+        # Text-rich pages are never scanned, so only low-text pages are
+        # probed; the text length is reused by the detector
+        scanned = []
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+            text_length = len(page.get_text().strip())
+            if (text_length <= 200 and
+                    self.ocr_extractor.detect_scanned_page_fast(page, text_length)):
+                scanned.append(page_num)
+        if not scanned:
+            return {}
+
+        if not self.config.get('enable_ocr', True):
+            return dict.fromkeys(scanned, "")
+
+        self.logger.info(
+            f"Pages {', '.join(map(str, scanned))} appear to be scanned, applying OCR...")
+        texts = self.ocr_extractor.extract_text_from_scanned_pages(
+            [doc[page_num] for page_num in scanned],
+            self.config.get('ocr_language', 'eng'))
+        return dict(zip(scanned, texts))
+
+    def _process_page(self, page, page_num: int, output_dir: Path,
+                      scanned_text: Optional[str] = None) -> Dict[str, Any]:
+        """Process a single page with all extractors.
+
+        scanned_text is the OCR text of a scanned page, None otherwise.
+        """
         page_data = {
             'content': [],
             'images': [],
@@ -205,25 +308,22 @@ class PDFToMarkdownConverter(BaseConverter):
         }
 
         try:
-            # Check if page is scanned and needs OCR
-            is_scanned = self.ocr_extractor.detect_scanned_page(page)
-            page_data['is_scanned'] = is_scanned
-
-            if is_scanned and self.config.get('enable_ocr', True):
-                self.logger.info(
-                    f"Page {page_num} appears to be scanned, applying OCR...")
-                ocr_text = self.ocr_extractor.extract_text_from_scanned_page(
-                    page, page_num, self.config.get('ocr_language', 'eng'))
-                if ocr_text:
-                    page_data['content'].append(
-                        f"<!-- OCR Content from Page {page_num} -->")
-                    page_data['content'].append(ocr_text)
-                    return page_data
+            # Scanned pages were detected and OCRed before the page loop
+            page_data['is_scanned'] = scanned_text is not None
+
+            if scanned_text:
+                page_data['content'].append(
+                    f"<!-- OCR Content from Page {page_num} -->")
+                page_data['content'].append(scanned_text)
+                return page_data
+
+            # The text layout is parsed once and shared by the extractors
+            blocks = page.get_text("dict")
 
             # Enhanced image extraction
             if self.config.get('extract_images', True):
                 images = self.advanced_image_extractor.extract_images_from_page(
-                    page, page_num, output_dir / "images")
+                    page, page_num, output_dir / "images", blocks)
                 page_data['images'] = images
 
                 # Create markdown references for images
@@ -242,7 +342,7 @@ class PDFToMarkdownConverter(BaseConverter):
             # Enhanced table extraction
             if self.config.get('extract_tables', True):
                 tables = self.table_extractor.extract_tables_from_page(
-                    page, page_num)
+                    page, page_num, blocks)
                 page_data['tables'] = tables
 
                 # Convert tables to markdown
@@ -261,11 +361,11 @@ class PDFToMarkdownConverter(BaseConverter):
             # Extract footnotes
             if self.config.get('extract_footnotes', True):
                 footnotes = self.footnote_extractor.extract_footnotes_from_page(
-                    page, page_num)
+                    page, page_num, blocks)
                 page_data['footnotes'] = footnotes
 
             # Process regular text content
-            self._process_text_content(page, page_data)
+            self._process_text_content(page, page_data, blocks)
 
         except Exception as e:
             self.logger.warning(f"Error processing page {page_num}: {e}")
@@ -280,12 +380,12 @@ class PDFToMarkdownConverter(BaseConverter):
 
         return page_data
 
-    def _process_text_content(self, page, page_data: Dict[str, Any]):
+    def _process_text_content(self, page, page_data: Dict[str, Any], blocks: Dict):
         """Process text content with heading detection and formatting."""
         # Handle multi-column layout
         if self.config.get('handle_multi_column', True):
             multi_column_text = self.text_extractor.handle_multi_column_text(
-                page)
+                page, blocks)
             if multi_column_text:
                 for text in multi_column_text:
                     text = self.text_extractor.handle_mathematical_content(
@@ -295,23 +395,21 @@ class PDFToMarkdownConverter(BaseConverter):
 
         # Regular text processing
         current_paragraph = []
-        blocks = page.get_text("dict")
 
         for block in blocks.get("blocks", []):
             if "lines" in block:
-                block_text = ""
-                font_info = None
+                lines = block["lines"]
+                block_text = " ".join(
+                    "".join(span["text"] for span in line["spans"])
+                    for line in lines)
 
-                for line in block["lines"]:
-                    line_text = ""
-                    for span in line["spans"]:
-                        text = span["text"]
-                        font_size = span["size"]
-                        font_flags = span["flags"]
-                        font_info = (font_size, font_flags)
-                        line_text += text
-
-                    block_text += line_text + " "
+                # Font of the last span in the block drives heading detection
+                font_info = None
+                for line in reversed(lines):
+                    if line["spans"]:
+                        last_span = line["spans"][-1]
+                        font_info = (last_span["size"], last_span["flags"])
+                        break
 
                 block_text = self.text_extractor.clean_text(block_text)
                 block_text = self.text_extractor.handle_mathematical_content(
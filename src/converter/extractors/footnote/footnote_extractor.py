@@ -1,10 +1,13 @@
 """Footnote extraction functionality for PDF processing."""
 
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..base import BaseExtractor
 
+_DIGITS_RE = re.compile(r'^\d+$')
+_LEADING_DIGIT_RE = re.compile(r'^\d+')
+
 
 class FootnoteExtractor(BaseExtractor):
     """Extract and process footnotes and endnotes."""
@@ -13,18 +16,21 @@ class FootnoteExtractor(BaseExtractor):
         super().__init__(config)
         self.footnote_markers = {}
 
-    def extract_footnotes_from_page(self, page, page_num: int) -> List[Dict[str, Any]]:
-        """Extract footnotes with their markers and content."""
+    def extract_footnotes_from_page(self, page, page_num: int,
+                                    blocks: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Extract footnotes with their markers and content.
+
+        blocks is the page's get_text("dict") result, if already parsed.
+        """
         footnotes = []
 
         try:
-            blocks = page.get_text("dict")
+            if blocks is None:
+                blocks = page.get_text("dict")
 
-            # Find footnote markers in main text
-            markers = self._find_footnote_markers(blocks)
-
-            # Find footnote content (usually at bottom of page or in smaller font)
-            content = self._find_footnote_content(blocks)
+            # Find footnote markers in main text and footnote content
+            # (usually at bottom of page or in smaller font) in one sweep
+            markers, content = self._scan_footnote_blocks(blocks)
 
             # Match markers with content
             matched_footnotes = self._match_markers_with_content(
@@ -37,77 +43,83 @@ class FootnoteExtractor(BaseExtractor):
 
         return footnotes
 
-    def _find_footnote_markers(self, blocks: Dict) -> List[Dict]:
-        """Find footnote markers in the main text."""
-        markers = []
+    def _scan_footnote_blocks(self, blocks: Dict) -> Tuple[List[Dict], List[Dict]]:
+        """Find footnote markers and footnote content in one pass.
 
-        for block in blocks.get("blocks", []):
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"]
-
-                        # Look for superscript numbers or symbols
-                        if span.get("flags", 0) & 2**4:  # Superscript flag
-                            if re.match(r'^\d+$', text.strip()):
-                                markers.append({
-                                    'number': int(text.strip()),
-                                    'bbox': span["bbox"],
-                                    'text': text
-                                })
-
-        return markers
-
-    def _find_footnote_content(self, blocks: Dict) -> List[Dict]:
-        """Find footnote content (usually smaller font at bottom)."""
+        Markers are superscript numbers in the main text; content blocks
+        are small-font blocks that start with a number.
+        """
+        markers = []
         content = []
+        add_marker = markers.append
 
         for block in blocks.get("blocks", []):
-            if "lines" in block:
-                block_text = ""
-                avg_font_size = 0
-                font_count = 0
-
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        block_text += span["text"]
-                        avg_font_size += span.get("size", 0)
-                        font_count += 1
-
-                if font_count > 0:
-                    avg_font_size /= font_count
-
-                # Check if this looks like footnote content
-                if (avg_font_size < 10 and  # Small font
-                    # Starts with number
-                    re.match(r'^\d+', block_text.strip()) and
-                        len(block_text.strip()) > 20):  # Has substantial content
-
-                    content.append({
-                        'text': block_text.strip(),
-                        'bbox': block["bbox"],
-                        'font_size': avg_font_size
-                    })
-
-        return content
+            lines = block.get("lines")
+            if lines is None:
+                continue
+
+            parts = []
+            add_part = parts.append
+            total_size = 0
+            span_count = 0
+
+            for line in lines:
+                for span in line["spans"]:
+                    text = span["text"]
+                    add_part(text)
+                    total_size += span.get("size", 0)
+                    span_count += 1
+
+                    # Look for superscript numbers or symbols
+                    if span.get("flags", 0) & 16:  # Superscript flag
+                        stripped = text.strip()
+                        if _DIGITS_RE.match(stripped):
+                            add_marker({
+                                'number': int(stripped),
+                                'bbox': span["bbox"],
+                                'text': text
+                            })
+
+            avg_font_size = total_size / span_count if span_count else 0
+            block_text = "".join(parts).strip()
+
+            # Check if this looks like footnote content
+            if (avg_font_size < 10 and  # Small font
+                # Starts with number
+                _LEADING_DIGIT_RE.match(block_text) and
+                    len(block_text) > 20):  # Has substantial content
+
+                content.append({
+                    'text': block_text,
+                    'bbox': block["bbox"],
+                    'font_size': avg_font_size
+                })
+
+        return markers, content
 
     def _match_markers_with_content(self, markers: List[Dict], content: List[Dict], page_num: int) -> List[Dict]:
         """Match footnote markers with their content."""
         footnotes = []
 
+        # Index content by its leading footnote number (first block wins)
+        content_by_num = {}
+        for item in content:
+            match = _LEADING_DIGIT_RE.match(item['text'])
+            if match:
+                content_by_num.setdefault(int(match.group()), item)
+
         for marker in markers:
             marker_num = marker['number']
 
             # Find matching content
-            for item in content:
-                if item['text'].startswith(str(marker_num)):
-                    footnotes.append({
-                        'number': marker_num,
-                        'marker_bbox': marker['bbox'],
-                        'content_bbox': item['bbox'],
-                        'content': item['text'],
-                        'page': page_num
-                    })
-                    break
+            item = content_by_num.get(marker_num)
+            if item:
+                footnotes.append({
+                    'number': marker_num,
+                    'marker_bbox': marker['bbox'],
+                    'content_bbox': item['bbox'],
+                    'content': item['text'],
+                    'page': page_num
+                })
 
         return footnotes
@@ -2,72 +2,198 @@
 
 import re
 import fitz
+import numpy as np
+from concurrent.futures import Executor, Future
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 from ..base import BaseExtractor
+from .image_extractor import _RAW_IMAGE_EXTS
+
+# Figure, table/chart and diagram keywords in priority order, matched
+# case-insensitively so nearby text need not be lowered. The alternatives
+# sit in a zero-width lookahead, so overlapping hits such as the "chart"
+# in "flowchart" are all reported by a single scan.
+_KEYWORD_RE = re.compile(
+    r'(?=(?P<figure>\bfig\.?\s*\d+|figure\s*\d+)'
+    r'|(?P<table_image>\btable\s*\d+|chart|graph)'
+    r'|(?P<diagram>diagram|flowchart|schema|architecture))', re.IGNORECASE)
+# Every keyword match contains one of these words, and words cannot span
+# the gaps between joined spans, so a page without them needs no
+# per-image keyword scan. Kept case-insensitive like the full pattern,
+# since str.lower() misses matches such as the long s.
+_KEYWORD_HINT_RE = re.compile(
+    r'fig|table|chart|graph|diagram|schema|architecture', re.IGNORECASE)
+# Applied to lowered text, since captions are reported in lower case
+_CAPTION_PATTERNS = [re.compile(p) for p in (
+    r'fig\.?\s*\d+[:.]\s*([^.]+)',
+    r'figure\s*\d+[:.]\s*([^.]+)',
+    r'caption[:.]\s*([^.]+)',
+)]
+
+# Page regions indexed by vertical third * 3 + horizontal third
+_POSITIONS = (
+    "top-left", "top-center", "top-right",
+    "middle-left", "middle-center", "middle-right",
+    "bottom-left", "bottom-center", "bottom-right",
+)
+
+
+def _text_block_index(blocks: Dict) -> Tuple[List[str], np.ndarray, bool]:
+    """Index the text blocks of a page dict.
+
+    Returns the span texts of each block joined by spaces, the block
+    bboxes as an (N, 4) array and whether the page text contains any
+    image keyword at all. Blocks without spans add nothing to nearby
+    text, so they are left out.
+    """
+    block_texts = []
+    block_bboxes = []
+    for block in blocks.get("blocks", []):
+        spans = [span["text"]
+                 for line in block.get("lines", ())
+                 for span in line["spans"]]
+        if spans:
+            block_texts.append(" ".join(spans))
+            block_bboxes.append(block["bbox"])
+
+    bboxes = np.asarray(block_bboxes, dtype=np.float64).reshape(-1, 4)
+    has_keywords = _KEYWORD_HINT_RE.search("\n".join(block_texts)) is not None
+    return block_texts, bboxes, has_keywords
 
 
 class AdvancedImageExtractor(BaseExtractor):
     """Advanced image extraction with figure detection and smart naming."""
 
-    def __init__(self, config):
+    def __init__(self, config, io_pool: Optional[Executor] = None):
         super().__init__(config)
         self.figure_counter = 0
         self.table_counter = 0
         self.diagram_counter = 0
 
-    def extract_images_from_page(self, page, page_num: int, output_dir: Path) -> List[Dict[str, Any]]:
-        """Extract images with enhanced metadata and categorization."""
+        # Optional executor for image file writes, so page parsing can
+        # continue while earlier images are still being written to disk
+        self.io_pool = io_pool
+        self._pending_writes = []
+
+        # (blocks dict, block texts, bbox array, keyword hint) of the last
+        # page looked at
+        self._block_index = None
+
+        # xref -> image entry already written for the current document
+        self._saved_images = {}
+        self._images_doc = None
+
+    def extract_images_from_page(self, page, page_num: int, output_dir: Path,
+                                 blocks: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Extract images with enhanced metadata and categorization.
+
+        blocks is the page's get_text("dict") result, if already parsed.
+        """
         if not self.config.get('extract_images', True):
             return []
 
         images = []
+        doc = page.parent
+
+        # Image xrefs are per document, so start a fresh cache for a new one
+        if doc is not self._images_doc:
+            self._images_doc = doc
+            self._saved_images = {}
+
+        # Bound once here rather than looked up for every image
+        saved_images = self._saved_images
+        add_image = images.append
+        image_context = self._extract_image_context
+        log_debug = self.logger.debug
+        rect = page.rect
+        page_size = (rect.width, rect.height)
 
         try:
             image_list = page.get_images()
+            # Parsed once and shared by the context lookups of every image
+            if blocks is None and image_list:
+                blocks = page.get_text("dict")
 
             for img_index, img in enumerate(image_list):
                 try:
                     # Get image data
                     xref = img[0]
-                    pix = fitz.Pixmap(page.parent, xref)
+                    saved = saved_images.get(xref)
+                    if saved is not None:
+                        # Same image on an earlier page: reuse the written
+                        # file instead of decoding and saving it again
+                        add_image({
+                            **saved,
+                            'page': page_num,
+                            'index': img_index,
+                            'bbox': img[1:5] if len(img) > 4 else None,
+                            'context': image_context(
+                                page, img, blocks, page_size=page_size)
+                        })
+                        continue
+
+                    # Stored image bytes and metadata, without decoding
+                    info = doc.extract_image(xref)
+
+                    if info and info["colorspace"] < 4:  # GRAY or RGB
+                        size = (info["width"], info["height"])
+                        ext = info["ext"]
+                        data = info["image"]
+                        if ext not in _RAW_IMAGE_EXTS:
+                            # Not web-displayable, re-encode as PNG
+                            pix = fitz.Pixmap(doc, xref)
+                            data = pix.tobytes("png")
+                            ext = "png"
+                            pix = None
+
+                        # Text around the image, for the analysis (50pt) and
+                        # for the context (100pt), from one pass over blocks
+                        bbox = img[1:5] if len(img) > 4 else None
+                        near_text, context_text = (
+                            self._extract_nearby_texts(
+                                page, bbox, (50, 100), blocks)
+                            if bbox else ("", ""))
 
-                    if pix.n - pix.alpha < 4:  # GRAY or RGB
                         # Analyze image content to determine type
                         image_info = self._analyze_image_content(
-                            page, img, pix)
+                            page, img, size, blocks, nearby_text=near_text,
+                            has_keywords=self._get_block_index(blocks)[3])
 
                         # Generate intelligent filename
                         filename = self._generate_smart_filename(
-                            image_info, page_num, img_index)
+                            image_info, page_num, img_index, ext)
 
                         # Save image
                         img_path = output_dir / filename
-                        pix.save(str(img_path))
+                        write = self._write_image(data, img_path)
 
                         # Extract surrounding context
-                        context = self._extract_image_context(page, img)
+                        context = image_context(
+                            page, img, blocks, preceding_text=context_text,
+                            page_size=page_size)
 
-                        images.append({
+                        entry = {
                             'filename': filename,
                             'path': str(img_path),
                             'page': page_num,
                             'index': img_index,
                             'type': image_info['type'],
-                            'size': (pix.width, pix.height),
+                            'size': size,
                             'bbox': img[1:5] if len(img) > 4 else None,
                             'context': context,
                             'caption': image_info.get('caption'),
                             'is_figure': image_info.get('is_figure', False),
                             'confidence': image_info.get('confidence', 0.5)
-                        })
+                        }
+                        add_image(entry)
+                        saved_images[xref] = entry
+                        if write is not None:
+                            self._pending_writes.append((write, xref, entry))
 
-                        self.logger.debug(
+                        log_debug(
                             f"Extracted {image_info['type']}: {filename}")
 
-                    pix = None
-
                 except Exception as e:
                     self.logger.warning(
                         f"Failed to extract image {img_index} from page {page_num}: {e}")
@@ -79,16 +205,50 @@ class AdvancedImageExtractor(BaseExtractor):
 
         return images
 
-    def _analyze_image_content(self, page, img, pix) -> Dict[str, Any]:
+    def _write_image(self, data: bytes, img_path: Path) -> Optional[Future]:
+        """Write image bytes, handing the disk write to the I/O pool if set.
+
+        Returns the future of a deferred write, or None if written here.
+        """
+        if self.io_pool is None:
+            img_path.write_bytes(data)
+            return None
+
+        return self.io_pool.submit(img_path.write_bytes, data)
+
+    def flush_pending_writes(self) -> List[str]:
+        """Block until all deferred image writes have completed.
+
+        Images whose write failed are dropped from the repeated-image cache
+        and their filenames returned, so callers can drop references to them.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        failed = []
+        for future, xref, entry in pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to write image {entry['filename']}: {e}")
+                if self._saved_images.get(xref) is entry:
+                    del self._saved_images[xref]
+                failed.append(entry['filename'])
+        return failed
+
+    def _analyze_image_content(self, page, img, size: Tuple[int, int],
+                               blocks: Optional[Dict] = None,
+                               nearby_text: Optional[str] = None,
+                               has_keywords: bool = True) -> Dict[str, Any]:
         """Analyze image content to determine type and characteristics."""
-        width, height = pix.width, pix.height
+        width, height = size
         aspect_ratio = width / height if height > 0 else 1
 
-        # Get image position on page
-        bbox = img[1:5] if len(img) > 4 else None
-
-        # Extract nearby text for context
-        nearby_text = self._extract_nearby_text(page, bbox) if bbox else ""
+        # Extract nearby text for context, unless the caller already has it
+        if nearby_text is None:
+            # Get image position on page
+            bbox = img[1:5] if len(img) > 4 else None
+            nearby_text = self._extract_nearby_text(
+                page, bbox, blocks=blocks) if bbox else ""
 
         # Determine image type based on various factors
         image_type = "image"
@@ -96,8 +256,17 @@ class AdvancedImageExtractor(BaseExtractor):
         is_figure = False
         caption = None
 
+        # Keyword kinds present near the image; a figure keyword outranks
+        # everything, so the scan can stop there
+        keywords = set()
+        if has_keywords:
+            for match in _KEYWORD_RE.finditer(nearby_text):
+                keywords.add(match.lastgroup)
+                if match.lastgroup == "figure":
+                    break
+
         # Check for figure indicators
-        if re.search(r'\bfig\.?\s*\d+|figure\s*\d+', nearby_text.lower()):
+        if "figure" in keywords:
             image_type = "figure"
             is_figure = True
             confidence = 0.9
@@ -105,13 +274,13 @@ class AdvancedImageExtractor(BaseExtractor):
             caption = self._extract_figure_caption(nearby_text)
 
         # Check for table/chart indicators
-        elif re.search(r'\btable\s*\d+|chart|graph', nearby_text.lower()):
+        elif "table_image" in keywords:
             image_type = "table_image"
             confidence = 0.8
             self.table_counter += 1
 
         # Check for diagram indicators
-        elif re.search(r'diagram|flowchart|schema|architecture', nearby_text.lower()):
+        elif "diagram" in keywords:
             image_type = "diagram"
             confidence = 0.8
             self.diagram_counter += 1
@@ -139,7 +308,8 @@ class AdvancedImageExtractor(BaseExtractor):
             'nearby_text': nearby_text[:200]  # First 200 chars
         }
 
-    def _generate_smart_filename(self, image_info: Dict, page_num: int, img_index: int) -> str:
+    def _generate_smart_filename(self, image_info: Dict, page_num: int, img_index: int,
+                                 ext: str = "png") -> str:
         """Generate intelligent filename based on image analysis."""
         image_type = image_info['type']
 
@@ -154,53 +324,60 @@ class AdvancedImageExtractor(BaseExtractor):
         else:
             base_name = f"image_{page_num}_{img_index}"
 
-        return f"{base_name}.png"
+        return f"{base_name}.{ext}"
 
-    def _extract_nearby_text(self, page, bbox: Tuple[float, float, float, float], radius: float = 50) -> str:
+    def _extract_nearby_text(self, page, bbox: Tuple[float, float, float, float], radius: float = 50,
+                             blocks: Optional[Dict] = None) -> str:
         """Extract text near an image for context analysis."""
         if not bbox:
             return ""
 
+        return self._extract_nearby_texts(page, bbox, (radius,), blocks)[0]
+
+    def _extract_nearby_texts(self, page, bbox: Tuple[float, float, float, float],
+                              radii: Sequence[float],
+                              blocks: Optional[Dict] = None) -> List[str]:
+        """Extract the text near an image for several search radii."""
         x1, y1, x2, y2 = bbox
 
-        # Expand search area
-        search_bbox = (
-            x1 - radius, y1 - radius,
-            x2 + radius, y2 + radius
-        )
+        if blocks is None:
+            blocks = page.get_text("dict")
+
+        _, block_texts, bboxes, _ = self._get_block_index(blocks)
 
-        nearby_text = []
-        blocks = page.get_text("dict")
+        results = []
+        for radius in radii:
+            # Check which blocks are near the image, all at once
+            sx1, sy1 = x1 - radius, y1 - radius
+            sx2, sy2 = x2 + radius, y2 + radius
+            near = ~((bboxes[:, 2] < sx1) | (bboxes[:, 0] > sx2) |
+                     (bboxes[:, 3] < sy1) | (bboxes[:, 1] > sy2))
 
-        for block in blocks.get("blocks", []):
-            if "lines" in block:
-                block_bbox = block["bbox"]
+            results.append(" ".join(
+                [block_texts[idx] for idx in np.flatnonzero(near)]))
 
-                # Check if block is near the image
-                if self._bbox_intersects(block_bbox, search_bbox):
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            nearby_text.append(span["text"])
+        return results
 
-        return " ".join(nearby_text)
+    def _get_block_index(self, blocks: Dict) -> Tuple:
+        """Return the text block index, reused while the page dict is the same."""
+        if self._block_index is None or self._block_index[0] is not blocks:
+            self._block_index = (blocks, *_text_block_index(blocks))
+        return self._block_index
 
     def _extract_figure_caption(self, text: str) -> Optional[str]:
         """Extract figure caption from nearby text."""
         # Look for caption patterns
-        patterns = [
-            r'fig\.?\s*\d+[:.]\s*([^.]+)',
-            r'figure\s*\d+[:.]\s*([^.]+)',
-            r'caption[:.]\s*([^.]+)'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        text = text.lower()
+        for pattern in _CAPTION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _extract_image_context(self, page, img) -> Dict[str, Any]:
+    def _extract_image_context(self, page, img, blocks: Optional[Dict] = None,
+                               preceding_text: Optional[str] = None,
+                               page_size: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
         """Extract contextual information about the image."""
         bbox = img[1:5] if len(img) > 4 else None
 
@@ -208,39 +385,36 @@ class AdvancedImageExtractor(BaseExtractor):
             return {}
 
         # Look for preceding and following text
-        preceding_text = self._extract_nearby_text(page, bbox, 100)
+        if preceding_text is None:
+            preceding_text = self._extract_nearby_text(
+                page, bbox, 100, blocks)
+
+        if page_size is None:
+            rect = page.rect
+            page_size = (rect.width, rect.height)
 
         return {
             'preceding_text': preceding_text[:500],  # Limit length
             'bbox': bbox,
-            'page_position': self._describe_position(bbox, page.rect)
+            'page_position': self._describe_position(bbox, *page_size)
         }
 
-    def _describe_position(self, bbox: Tuple, page_rect) -> str:
+    def _describe_position(self, bbox: Tuple, page_width: float,
+                           page_height: float) -> str:
         """Describe the position of an element on the page."""
         x1, y1, x2, y2 = bbox
-        page_width = page_rect.width
-        page_height = page_rect.height
 
-        # Determine horizontal position
+        # Row/column index into the 3x3 grid: 0 below the first third,
+        # 2 past the second, 1 otherwise
         center_x = (x1 + x2) / 2
-        if center_x < page_width * 0.33:
-            h_pos = "left"
-        elif center_x > page_width * 0.67:
-            h_pos = "right"
-        else:
-            h_pos = "center"
+        h_idx = (center_x >= page_width * 0.33) + \
+            (center_x > page_width * 0.67)
 
-        # Determine vertical position
         center_y = (y1 + y2) / 2
-        if center_y < page_height * 0.33:
-            v_pos = "top"
-        elif center_y > page_height * 0.67:
-            v_pos = "bottom"
-        else:
-            v_pos = "middle"
+        v_idx = (center_y >= page_height * 0.33) + \
+            (center_y > page_height * 0.67)
 
-        return f"{v_pos}-{h_pos}"
+        return _POSITIONS[v_idx * 3 + h_idx]
 
     def _bbox_intersects(self, bbox1: Tuple, bbox2: Tuple) -> bool:
         """Check if two bounding boxes intersect."""
@@ -1,11 +1,16 @@
 """Basic image extraction functionality for PDF processing."""
 
 import fitz
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 from ..base import BaseExtractor
 
+# Stored image formats that can be written out as-is; anything else
+# (JPEG 2000, JBIG2, ...) is re-encoded to PNG
+_RAW_IMAGE_EXTS = frozenset(('png', 'jpeg', 'jpg'))
+
 
 class ImageExtractor(BaseExtractor):
     """Extract images from PDF pages."""
@@ -19,47 +24,111 @@ class ImageExtractor(BaseExtractor):
         images_dir.mkdir(parents=True, exist_ok=True)
 
         image_refs = []
-        image_count = 0
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            image_list = page.get_images()
-
-            for img_index, img in enumerate(image_list):
+        # xref -> saved path (None if skipped), so images repeated across
+        # pages such as logos are only decoded once
+        seen = {}
+
+        # PyMuPDF must only be driven from one thread, so pages are read
+        # here in order and just the file writes go to worker threads
+        workers = self.config.get('image_write_workers', 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            writes = []
+            for page_num in range(len(doc)):
+                image_refs.extend(self._extract_page_images(
+                    doc, page_num, images_dir, seen, pool, writes))
+
+            failed = set()
+            for future, image_filename in writes:
                 try:
-                    # Get image data
-                    xref = img[0]
-                    pix = fitz.Pixmap(doc, xref)
-
-                    # Skip images that are too small (likely artifacts)
-                    if pix.width < 50 or pix.height < 50:
-                        pix = None
-                        continue
-
-                    # Generate filename
-                    image_filename = f"image_{page_num+1}_{img_index+1}.png"
-                    image_path = images_dir / image_filename
-
-                    # Save image
-                    if pix.n - pix.alpha < 4:  # GRAY or RGB
-                        pix.save(str(image_path))
-                    else:  # CMYK: convert to RGB first
-                        pix1 = fitz.Pixmap(fitz.csRGB, pix)
-                        pix1.save(str(image_path))
-                        pix1 = None
-
-                    # Store relative path for markdown
-                    relative_path = f"images/{image_filename}"
-                    image_refs.append(relative_path)
-                    image_count += 1
-
-                    self.logger.debug(f"Extracted image: {image_filename}")
-                    pix = None
-
+                    future.result()
                 except Exception as e:
                     self.logger.warning(
-                        f"Failed to extract image {img_index} from page {page_num}: {e}")
-                    continue
+                        f"Failed to write image {image_filename}: {e}")
+                    failed.add(f"images/{image_filename}")
+
+        if failed:
+            image_refs = [ref for ref in image_refs if ref not in failed]
 
-        self.logger.info(f"Extracted {image_count} images")
+        self.logger.info(f"Extracted {len(set(image_refs))} images")
         return image_refs
+
+    def _extract_page_images(self, doc, page_num: int, images_dir: Path,
+                             seen: Dict[int, Optional[str]],
+                             pool: Executor, writes: List) -> List[str]:
+        """Save the images of one page and return their relative paths.
+
+        Raw image writes are submitted to ``pool`` and recorded in
+        ``writes`` as (future, filename) pairs.
+        """
+        page_refs = []
+        page = doc[page_num]
+        image_list = page.get_images()
+
+        for img_index, img in enumerate(image_list):
+            try:
+                # Get image data
+                xref = img[0]
+                if xref in seen:
+                    if seen[xref]:
+                        page_refs.append(seen[xref])
+                    continue
+
+                seen[xref] = None
+                # The image list already carries the pixel size, so small
+                # images (likely artifacts) are skipped before reading them
+                if img[2] < 50 or img[3] < 50:
+                    continue
+
+                # Stored image bytes and metadata, without decoding
+                info = doc.extract_image(xref)
+                if not info:
+                    continue
+
+                # Skip images that are too small (likely artifacts)
+                if info["width"] < 50 or info["height"] < 50:
+                    continue
+
+                raw = (info["ext"] in _RAW_IMAGE_EXTS and
+                       info["colorspace"] < 4)
+                ext = info["ext"] if raw else "png"
+
+                # Generate filename
+                image_filename = f"image_{page_num+1}_{img_index+1}.{ext}"
+                image_path = images_dir / image_filename
+
+                # Save image
+                if raw:
+                    writes.append((pool.submit(image_path.write_bytes,
+                                               info["image"]),
+                                   image_filename))
+                else:
+                    self._save_as_png(doc, xref, image_path)
+                # Drop the stored bytes before the next image is read
+                info = None
+
+                # Store relative path for markdown
+                relative_path = f"images/{image_filename}"
+                page_refs.append(relative_path)
+                seen[xref] = relative_path
+
+                self.logger.debug(f"Extracted image: {image_filename}")
+
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to extract image {img_index} from page {page_num}: {e}")
+                continue
+
+        return page_refs
+
+    def _save_as_png(self, doc, xref: int, image_path: Path):
+        """Decode an image and let MuPDF write it out as PNG.
+
+        Saving straight from the pixmap avoids holding a second, encoded
+        copy in Python; the pixel buffers are freed when this returns.
+        """
+        pix = fitz.Pixmap(doc, xref)
+        # CMYK has to be converted to RGB for PNG; the converted pixmap
+        # replaces the source one, which is released right away
+        if pix.colorspace and pix.colorspace.n >= 4:
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+        pix.save(str(image_path))
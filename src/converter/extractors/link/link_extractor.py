@@ -2,9 +2,54 @@
 
 import re
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse
 
 from ..base import BaseExtractor
 
+try:
+    import re2  # Optional linear-time engine (google-re2)
+except ImportError:
+    re2 = None
+
+
+# re2's \d and \s are ASCII-only, while re matches any Unicode decimal
+# digit and every character for which str.isspace() holds; these spell
+# out the re meaning so both engines find the same citations
+_RE2_CLASSES = {
+    r'\d': r'\p{Nd}',
+    r'\s': '[\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a'
+           '\u2028\u2029\u202f\u205f\u3000]',
+}
+
+
+def _compile_scan(pattern: str):
+    """Compile a whole-page scan pattern, with re2 when it is installed.
+
+    re2 runs in linear time regardless of the pattern; if the module is
+    missing or rejects the pattern, the standard re engine is used.
+    """
+    if re2 is not None:
+        re2_pattern = pattern
+        for escape, char_class in _RE2_CLASSES.items():
+            re2_pattern = re2_pattern.replace(escape, char_class)
+        try:
+            return re2.compile(re2_pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# [1], [1,2,3] | (Smith et al., 2020) | (2020); the named group holds
+# the reference itself, so match.lastgroup tells which form matched
+_CITATION_COMBINED = _compile_scan(
+    r'\[(?P<bracket>\d+(?:,\s*\d+)*)\]'
+    r'|\((?P<author>[A-Za-z]+(?:\s+et\s+al\.?)?,?\s+\d{4}[a-z]?)\)'
+    r'|\((?P<year>\d{4})\)')
+_FOOTNOTE_START_RE = re.compile(r'^\d+\s+[A-Za-z]')
+# A whole footnote-like line ("12 Some text"), found across the page text
+_FOOTNOTE_LINE_RE = re.compile(
+    r'^[^\S\n]*\d+[^\S\n]+[A-Za-z][^\n]*', re.MULTILINE)
+
 
 class LinkExtractor(BaseExtractor):
     """Extract and process links, cross-references, and citations."""
@@ -74,38 +119,33 @@ class LinkExtractor(BaseExtractor):
         citations = []
         footnotes = []
 
-        # Citation patterns
-        citation_patterns = [
-            r'\[(\d+(?:,\s*\d+)*)\]',  # [1], [1,2,3]
-            # (Smith et al., 2020)
-            r'\(([A-Za-z]+(?:\s+et\s+al\.?)?,?\s+\d{4}[a-z]?)\)',
-            r'\((\d{4})\)',  # (2020)
-        ]
-
-        for pattern in citation_patterns:
-            for match in re.finditer(pattern, text):
-                citations.append({
-                    'text': match.group(0),
-                    'reference': match.group(1),
-                    'page': page_num,
-                    'position': match.start(),
-                    'type': 'citation'
-                })
-
-        # Footnote patterns
-        footnote_patterns = [
-            r'(\d+)\s*([^\n]+)',  # Footnote text
-        ]
-
-        lines = text.split('\n')
-        for line_num, line in enumerate(lines):
-            if self._looks_like_footnote(line):
-                footnotes.append({
-                    'text': line.strip(),
-                    'page': page_num,
-                    'line': line_num,
-                    'type': 'footnote'
-                })
+        # Citation patterns, all found in one scan of the page text
+        for match in _CITATION_COMBINED.finditer(text):
+            citations.append({
+                'text': match.group(0),
+                'reference': match.group(match.lastgroup),
+                'page': page_num,
+                'position': match.start(),
+                'type': 'citation'
+            })
+
+        # Footnote-like lines straight from the text, counting line breaks
+        # between matches instead of splitting the page into lines
+        line_num = 0
+        last_pos = 0
+        for match in _FOOTNOTE_LINE_RE.finditer(text):
+            line = match.group().strip()
+            if len(line) < 10:
+                continue
+
+            line_num += text.count('\n', last_pos, match.start())
+            last_pos = match.start()
+            footnotes.append({
+                'text': line,
+                'page': page_num,
+                'line': line_num,
+                'type': 'footnote'
+            })
 
         return {'citations': citations, 'footnotes': footnotes}
 
@@ -117,7 +157,6 @@ class LinkExtractor(BaseExtractor):
     def _extract_domain(self, uri: str) -> Optional[str]:
         """Extract domain from URL."""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(uri)
             return parsed.netloc
         except:
@@ -130,4 +169,4 @@ class LinkExtractor(BaseExtractor):
             return False
 
         # Check if starts with number and has reasonable content
-        return bool(re.match(r'^\d+\s+[A-Za-z]', line))
+        return bool(_FOOTNOTE_START_RE.match(line))
@@ -1,21 +1,74 @@
 """OCR extraction functionality for PDF processing."""
 
+import os
 import re
+import threading
 import fitz
-from typing import Optional, Tuple
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from ..base import BaseExtractor
 
+# Blank-line runs become one blank line, space runs one space; single
+# spaces are left alone so they need no replacement call
+_OCR_WS_RE = re.compile(r'\n\s*\n| {2,}')
+# Fix common OCR errors: lone 1 -> I and 0 -> O before a lowercase word
+_OCR_DIGIT_FIX_RE = re.compile(r'\b[10]\b(?=\s*[a-z])')
+_OCR_DIGIT_FIXES = {'1': 'I', '0': 'O'}
+_OCR_LITERAL_FIXES = [
+    ('rn', 'm'),  # rn -> m
+    ('cl', 'd'),   # cl -> d (sometimes)
+]
+# Table columns are split on multiple spaces or common separators
+_OCR_COLUMN_SPLIT_RE = re.compile(r'\s{2,}|\t+|\|')
+
+
+def _ocr_ws_sub(match) -> str:
+    return '\n\n' if match.group()[0] == '\n' else ' '
+
+
+def _ocr_digit_sub(match) -> str:
+    return _OCR_DIGIT_FIXES[match.group()]
+
 
 class OCRExtractor(BaseExtractor):
     """Handle OCR for scanned pages and image-based content."""
 
     def __init__(self, config):
         super().__init__(config)
-        self.ocr_engine = self._initialize_ocr_engine()
+        # The engine is loaded on first OCR, so scanned-page detection
+        # works without importing Tesseract
+        self._ocr_engine = None
+        self._ocr_engine_loaded = False
+
+        # With tesserocr, Tesseract stays loaded in-process; idle engines
+        # are kept as [api, language] pairs and reused across pages
+        self._resident_engine = False
+        self._idle_tess_apis = []
+        self._tess_lock = threading.Lock()
+
+    @property
+    def ocr_engine(self):
+        """OCR engine, initialized on first use (None if unavailable)."""
+        if not self._ocr_engine_loaded:
+            self._ocr_engine_loaded = True
+            self._ocr_engine = self._initialize_ocr_engine()
+        return self._ocr_engine
 
     def _initialize_ocr_engine(self):
-        """Initialize OCR engine (Tesseract)."""
+        """Initialize OCR engine (Tesseract).
+
+        tesserocr is preferred, since its engines stay loaded between
+        pages; pytesseract starts a tesseract process for every call.
+        """
+        try:
+            import tesserocr
+            self._resident_engine = True
+            return tesserocr
+        except ImportError:
+            pass
+
         try:
             import pytesseract
             return pytesseract
@@ -24,84 +77,219 @@ class OCRExtractor(BaseExtractor):
                 "Tesseract not available. OCR functionality disabled.")
             return None
 
-    def detect_scanned_page(self, page) -> bool:
-        """Detect if a page is likely scanned (image-only)."""
+    def close(self):
+        """Free the resident Tesseract engines."""
+        with self._tess_lock:
+            idle, self._idle_tess_apis = self._idle_tess_apis, []
+        for api, _ in idle:
+            api.End()
+
+    def _run_ocr(self, image: np.ndarray, psm: int, language: Optional[str] = None) -> str:
+        """Run Tesseract on a rendered image with a page segmentation mode."""
+        if not self._resident_engine:
+            config = f'--psm {psm}'
+            if language:
+                config += f' -l {language}'
+            return self.ocr_engine.image_to_string(image, config=config)
+
+        # Tesseract's own default language when none is given
+        language = language or 'eng'
+        entry = self._acquire_tess_api(language)
+        try:
+            api = entry[0]
+            api.SetPageSegMode(psm)
+            height, width = image.shape[:2]
+            channels = image.shape[2] if image.ndim == 3 else 1
+            api.SetImageBytes(np.ascontiguousarray(image).tobytes(),
+                              width, height, channels, width * channels)
+            return api.GetUTF8Text()
+        finally:
+            with self._tess_lock:
+                self._idle_tess_apis.append(entry)
+
+    def _acquire_tess_api(self, language: str) -> list:
+        """Take an idle tesserocr engine for language, loading one if none is free.
+
+        An engine serves one thread at a time, so concurrent OCR calls each
+        get their own; a reused engine is only re-initialised when it was
+        loaded with a different language.
+        """
+        with self._tess_lock:
+            idle = self._idle_tess_apis
+            for i, entry in enumerate(idle):
+                if entry[1] == language:
+                    return idle.pop(i)
+            entry = idle.pop() if idle else None
+
+        if entry is None:
+            return [self.ocr_engine.PyTessBaseAPI(lang=language), language]
+
+        entry[0].Init(lang=language)
+        entry[1] = language
+        return entry
+
+    def detect_scanned_page(self, page, text_length: Optional[int] = None) -> bool:
+        """Detect if a page is likely scanned (image-only).
+
+        text_length is the length of the page's stripped text, when the
+        caller has already extracted it.
+        """
         try:
-            # Get text content
-            text = page.get_text().strip()
+            # Get text content; a page with real text is not scanned, so
+            # the image list is only read when there is little of it
+            if text_length is None:
+                text_length = len(page.get_text().strip())
+            if text_length >= 50:
+                return False
 
             # Get images
             images = page.get_images()
 
             # If page has very little text but large images, likely scanned
-            if len(text) < 50 and len(images) > 0:
-                # Check if images cover most of the page
-                page_area = page.rect.width * page.rect.height
-                image_area = 0
-
-                for img in images:
-                    if len(img) > 4:
-                        bbox = img[1:5]
-                        img_area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
-                        image_area += img_area
+            if len(images) > 0:
+                # Check if images cover most of the page; the image list
+                # holds sizes, not positions, so the areas come from where
+                # each image is placed
+                rect = page.rect
+                page_area = rect.width * rect.height
+                bboxes = np.array([tuple(r) for img in images
+                                   for r in page.get_image_rects(img[0])],
+                                  dtype=np.float64).reshape(-1, 4)
+                image_area = np.prod(bboxes[:, 2:4] - bboxes[:, 0:2],
+                                     axis=1).sum()
 
                 coverage = image_area / page_area if page_area > 0 else 0
-                return coverage > 0.7  # 70% image coverage suggests scanned page
+                return bool(coverage > 0.7)  # 70% image coverage suggests scanned page
 
         except Exception as e:
             self.logger.warning(f"Failed to detect if page is scanned: {e}")
 
         return False
 
-    def extract_text_from_scanned_page(self, page, page_num: int, language: str = 'eng') -> str:
-        """Extract text from a scanned page using OCR."""
-        if not self.ocr_engine:
-            return ""
+    def detect_scanned_page_fast(self, page, text_length: Optional[int] = None) -> bool:
+        """Cheap scanned-page check based on a 32x32 grayscale thumbnail.
 
+        A near-uniform thumbnail means a blank page with nothing to OCR;
+        anything else falls through to detect_scanned_page, which is given
+        text_length.
+        """
         try:
-            # Convert page to image
-            # 2x zoom for better OCR
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-            img_data = pix.tobytes("png")
+            rect = page.rect
+            if rect.width <= 0 or rect.height <= 0:
+                return False
+
+            matrix = fitz.Matrix(32 / rect.width, 32 / rect.height)
+            pix = page.get_pixmap(
+                matrix=matrix, colorspace=fitz.csGRAY, alpha=False)
+            thumbnail = np.frombuffer(pix.samples, dtype=np.uint8)
 
-            # Configure OCR
-            # Page segmentation mode 1 (automatic with OSD)
-            config = f'--psm 1 -l {language}'
+            if np.var(thumbnail) < 1.0:
+                return False
 
-            # Run OCR
-            text = self.ocr_engine.image_to_string(img_data, config=config)
+        except Exception as e:
+            self.logger.warning(f"Fast scanned-page check failed: {e}")
 
-            # Clean up OCR output
-            cleaned_text = self._clean_ocr_text(text)
+        return self.detect_scanned_page(page, text_length)
 
-            self.logger.info(
-                f"OCR extracted {len(cleaned_text)} characters from page {page_num}")
+    def extract_text_from_scanned_page(self, page, page_num: int, language: str = 'eng') -> str:
+        """Extract text from a scanned page using OCR."""
+        if not self.ocr_engine:
+            return ""
 
-            return cleaned_text
+        try:
+            return self._ocr_page_image(
+                self._render_page(page), page_num, language)
 
         except Exception as e:
             self.logger.warning(f"OCR failed on page {page_num}: {e}")
             return ""
 
+    def extract_text_from_scanned_pages(self, pages, language: str = 'eng') -> List[str]:
+        """OCR several scanned pages, one result per page in input order.
+
+        Pages are rendered one after another (PyMuPDF is not thread-safe),
+        while Tesseract runs on a thread pool. pytesseract runs a separate
+        tesseract process per call and tesserocr releases the GIL while
+        recognising, so the threads overlap either way. At most two
+        rendered pages per thread are held in memory at once.
+        """
+        pages = list(pages)
+        if not self.ocr_engine or not pages:
+            return [""] * len(pages)
+
+        def ocr_one(page, image):
+            if image is None:
+                return ""
+            try:
+                return self._ocr_page_image(image, page.number, language)
+            except Exception as e:
+                self.logger.warning(f"OCR failed on page {page.number}: {e}")
+                return ""
+
+        workers = min(self.config.get('ocr_workers') or os.cpu_count() or 1,
+                      len(pages))
+        results = []
+        pending = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for page in pages:
+                try:
+                    image = self._render_page(page)
+                except Exception as e:
+                    self.logger.warning(
+                        f"OCR failed on page {page.number}: {e}")
+                    image = None
+                pending.append(pool.submit(ocr_one, page, image))
+
+                # Wait for the oldest page before rendering further ahead
+                if len(pending) >= workers * 2:
+                    results.append(pending.pop(0).result())
+
+            results.extend(future.result() for future in pending)
+        return results
+
+    def _render_page(self, page) -> np.ndarray:
+        """Render a page for OCR; 2x zoom for better OCR.
+
+        Tesseract binarises its input anyway, so rendering straight to
+        grayscale gives the same result from a third of the pixels.
+        """
+        return self._pixmap_to_array(page.get_pixmap(
+            matrix=fitz.Matrix(2, 2), colorspace=fitz.csGRAY, alpha=False))
+
+    def _ocr_page_image(self, image: np.ndarray, page_num: int, language: str) -> str:
+        """Run page OCR on a rendered page and clean the result."""
+        # Page segmentation mode 1 (automatic with OSD)
+        text = self._run_ocr(image, 1, language)
+
+        # Clean up OCR output
+        cleaned_text = self._clean_ocr_text(text)
+
+        self.logger.info(
+            f"OCR extracted {len(cleaned_text)} characters from page {page_num}")
+
+        return cleaned_text
+
+    def _pixmap_to_array(self, pix) -> np.ndarray:
+        """View pixmap samples as an (H, W[, N]) array, skipping PNG encoding."""
+        samples = np.frombuffer(pix.samples, dtype=np.uint8)
+        if pix.n == 1:
+            return samples.reshape(pix.height, pix.width)
+        return samples.reshape(pix.height, pix.width, pix.n)
+
     def _clean_ocr_text(self, text: str) -> str:
         """Clean and improve OCR output."""
         if not text:
             return ""
 
         # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-
-        # Fix common OCR errors
-        ocr_fixes = [
-            (r'\b1\b(?=\s*[a-z])', 'I'),  # 1 -> I
-            (r'\b0\b(?=\s*[a-z])', 'O'),  # 0 -> O
-            (r'rn', 'm'),  # rn -> m
-            (r'cl', 'd'),   # cl -> d (sometimes)
-        ]
+        text = _OCR_WS_RE.sub(_ocr_ws_sub, text)
 
-        for pattern, replacement in ocr_fixes:
-            text = re.sub(pattern, replacement, text)
+        # Fix common OCR errors; the digit pass only runs when there is a
+        # 1 or 0 for it to replace, which substring checks find at C speed
+        if '1' in text or '0' in text:
+            text = _OCR_DIGIT_FIX_RE.sub(_ocr_digit_sub, text)
+        for old, new in _OCR_LITERAL_FIXES:
+            text = text.replace(old, new)
 
         return text.strip()
 
@@ -114,13 +302,12 @@ class OCRExtractor(BaseExtractor):
             # Extract the table region as image
             rect = fitz.Rect(table_bbox)
             # High resolution for tables
-            pix = page.get_pixmap(matrix=fitz.Matrix(3, 3), clip=rect)
-            img_data = pix.tobytes("png")
+            pix = page.get_pixmap(matrix=fitz.Matrix(3, 3), clip=rect,
+                                  colorspace=fitz.csGRAY, alpha=False)
+            img_data = self._pixmap_to_array(pix)
 
             # Use table-specific OCR configuration
-            config = '--psm 6'  # Uniform block of text
-
-            text = self.ocr_engine.image_to_string(img_data, config=config)
+            text = self._run_ocr(img_data, 6)  # Uniform block of text
 
             # Convert to markdown table format
             table_markdown = self._ocr_text_to_table(text)
@@ -136,29 +323,26 @@ class OCRExtractor(BaseExtractor):
         if not text.strip():
             return None
 
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [line for line in map(str.strip, text.split('\n')) if line]
 
         if len(lines) < 2:
             return None
 
         # Try to detect column structure
-        table_lines = []
-        for line in lines:
-            # Split on multiple spaces or common separators
-            columns = re.split(r'\s{2,}|\t+|\|', line)
-            if len(columns) >= 2:
-                table_lines.append([col.strip() for col in columns])
+        table_lines = [[col.strip() for col in columns]
+                       for columns in map(_OCR_COLUMN_SPLIT_RE.split, lines)
+                       if len(columns) >= 2]
 
         if len(table_lines) < 2:
             return None
 
-        # Normalize column count
-        max_cols = max(len(row) for row in table_lines)
-        normalized_rows = []
-        for row in table_lines:
-            while len(row) < max_cols:
-                row.append("")
-            normalized_rows.append(row[:max_cols])
+        # Normalize column count; no row is wider than max_cols, so each
+        # short row is padded in place with one extend
+        max_cols = max(map(len, table_lines))
+        normalized_rows = table_lines
+        for row in normalized_rows:
+            if len(row) < max_cols:
+                row.extend([""] * (max_cols - len(row)))
 
         # Build markdown table
         markdown_lines = ["**OCR Table**", ""]
@@ -1,12 +1,489 @@
 """Advanced table extraction functionality for PDF processing."""
 
+import os
 import re
+import string
 import fitz
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
 from ..base import BaseExtractor
 
+try:
+    import hyperscan  # Optional multi-pattern engine (python-hyperscan)
+except ImportError:
+    hyperscan = None
+
+# Header-row cues for convert_table_to_markdown, matched on lowered text
+_HEADER_ROW_PATTERNS = [re.compile(p) for p in (
+    r'\b[a-z]{4,12}\b',  # Medium-length descriptive words
+    # Method/data patterns
+    r'\b\w*dat\w*\b|\b\w*model\w*\b|\b\w*method\w*\b|\b\w*approach\w*\b',
+    # Performance-related suffixes
+    r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b',
+    r'\b[A-Z]{2,}\s+\d{4}\b',  # Dataset patterns like "ISIC 2017"
+    r'\b\w+[-_]\w+\b',  # Hyphenated or underscore terms
+)]
+# Pipes and line breaks in a cell would break the markdown row
+_CELL_BREAK_TRANS = str.maketrans('|\n\r', '   ')
+
+# Column classifiers for _generate_smart_headers
+_CITATION_YEAR_RE = re.compile(r'\(.*\d{4}.*\)')
+_METHOD_NAME_RE = re.compile(r'\b[A-Za-z]+(?:[-_][A-ZaZ]+)*\b')
+_ACCURACY_RE = re.compile(r'\d+\.?\d*%|\b\w*acc\w*\b|\b\w*prec\w*\b')
+_LOSS_RE = re.compile(r'\b\w*loss\w*\b|\b\w*err\w*\b')
+_TIME_RE = re.compile(r'\b\w*time\w*\b|\b\w*speed\w*\b|\bms\b|\bs\b')
+_DATASET_RE = re.compile(r'\b\w*dat\w*\b|\b\w*corp\w*\b|\b\w*bench\w*\b')
+_ARCHITECTURE_RE = re.compile(r'\b\w*arch\w*\b|\b\w*net\w*\b|\b\w*model\w*\b')
+_TYPE_RE = re.compile(r'\b\w*type\w*\b|\b\w*class\w*\b|\b\w*categ\w*\b')
+
+# Numerical data typical of ML results, as one alternation so a single
+# search covers them all
+_NUMERIC_RE = re.compile('|'.join((
+    r'\d+\.\d+%',  # Percentages
+    r'\d+\.\d+\s*±\s*\d+\.\d+',  # Mean ± std (with or without spaces)
+    r'\d+\.\d{2,4}',  # Decimal numbers (accuracy, loss, etc.)
+    r'\d+,\d+',  # Large numbers with commas
+    r'\b\d+[kKmM]\b',  # Numbers with k/M suffixes
+)))
+# The only _NUMERIC_RE alternative that needs neither '.' nor ','
+_SUFFIX_NUMBER_RE = re.compile(r'\b\d+[kKmM]\b')
+
+
+def _search_numeric(text: str):
+    """_NUMERIC_RE.search, skipping the alternatives text cannot match.
+
+    Every alternative but the k/M suffix one needs a '.' or ',', which
+    plain substring checks rule out far faster than the regex engine.
+    """
+    if '.' in text or ',' in text:
+        return _NUMERIC_RE.search(text)
+    return _SUFFIX_NUMBER_RE.search(text)
+
+# Table title patterns, in order of preference
+_TABLE_TITLE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Standard formats
+    # Table 1. Title
+    r'table\s+(\d+)\.?\s*(.*)',
+    # Table 1 - Title or Table 1: Title
+    r'table\s+(\d+)\s*[-:]\s*(.*)',
+    # Table 1 . Title
+    r'table\s+(\d+)\s*\.\s*(.*)',
+    # Table 1 Title (no punctuation)
+    r'table\s+(\d+)\s+(.*)',
+
+    # Roman numerals
+    # Table I. Title
+    r'table\s+([ivxlc]+)\.?\s*(.*)',
+    # Table I - Title
+    r'table\s+([ivxlc]+)\s*[-:]\s*(.*)',
+
+    # Letter designations
+    # Table A. Title
+    r'table\s+([a-z])\.?\s*(.*)',
+    # Table A - Title
+    r'table\s+([a-z])\s*[-:]\s*(.*)',
+
+    # Alternative formats
+    # Table1. Title (no space)
+    r'table\s*(\d+)\.?\s*(.*)',
+    # Tab. 1. Title
+    r'tab\.\s*(\d+)\.?\s*(.*)',
+    # Tbl. 1. Title
+    r'tbl\.?\s*(\d+)\.?\s*(.*)',
+
+    # Multi-word variations
+    # Table 1. Multi-sentence title.
+    r'table\s+(\d+)\.\s*([^.]+\..*)',
+    # Table 1 – Title (various dashes)
+    r'table\s+(\d+)\s*[\-–—]\s*(.*)',
+
+    # Parenthetical numbering
+    # Table (1) Title
+    r'table\s*\((\d+)\)\s*(.*)',
+    # Table [1] Title
+    r'table\s*\[(\d+)\]\s*(.*)',
+
+    # No number (fallback)
+    # Table - Title or Table: Title
+    r'table\s*[-:]\s*(.*)',
+    # Table Title (last resort)
+    r'table\s+(.*)',
+)]
+
+# Header cues for lines without a "Table" title; the near-universal word
+# pattern goes first so counting can usually stop early
+_HEADER_LINE_INDICATORS = [re.compile(p, re.IGNORECASE) for p in (
+    # Hyphenated or underscore technical terms
+    r'\b[A-Za-z]+(?:[-_][A-Za-z]+)*\b',
+    # Performance-related suffixes
+    r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b',
+    r'\b\w*dat\w*\b|\b\w*corp\w*\b|\b\w*bench\w*\b',  # Data/corpus/benchmark patterns
+    r'\b\w*result\w*\b|\b\w*perform\w*\b|\b\w*score\w*\b|\b\w*metric\w*\b',  # Result patterns
+    r'\b\w*param\w*\b|\b\w*flop\w*\b',  # Parameter patterns
+    # Multiple capital letters (likely abbreviations)
+    r'\b[A-Z]{2,}\b.*\b[A-Z]{2,}\b',
+    # Numeric patterns suggesting column headers
+    r'\d+\s+\d+\s+\d+',
+)]
+
+
+def _compile_header_line_database():
+    """Compile the header cues into one hyperscan database, if installed.
+
+    The database reports every cue found in a single pass over the line;
+    if hyperscan is missing or rejects a pattern, None is returned and the
+    cues are searched one at a time.
+    """
+    if hyperscan is None:
+        return None
+    count = len(_HEADER_LINE_INDICATORS)
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[p.pattern.encode() for p in _HEADER_LINE_INDICATORS],
+            ids=list(range(count)), elements=count, flags=[flags] * count)
+    except hyperscan.error:
+        return None
+    return database
+
+
+_HEADER_LINE_DATABASE = _compile_header_line_database()
+# hyperscan's \w, \s and case folding only agree with re on printable ASCII
+# and tabs (it rejects \b in Unicode mode), so other lines use re
+_NON_ASCII_TEXT_RE = re.compile(r'[^\t -~]')
+
+
+def _count_header_cues(line_lower: str) -> Optional[int]:
+    """Count the header cues in a line with hyperscan, or None if unused."""
+    if (_HEADER_LINE_DATABASE is None or
+            _NON_ASCII_TEXT_RE.search(line_lower)):
+        return None
+
+    matched = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched.add(pattern_id)
+
+    _HEADER_LINE_DATABASE.scan(line_lower.encode('ascii'),
+                               match_event_handler=on_match)
+    return len(matched)
+
+
+# Table row and table content cues
+_DIGIT_RE = re.compile(r'\d')
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+_METHOD_START_RE = re.compile(r'^[A-Za-z][\w\-]+')
+_BRACKET_OR_YEAR_RE = re.compile(r'\[.*?\]|\(\d{4}\)')
+_PERCENT_RE = re.compile(r'\d+\.?\d*%')
+_MIXED_CONTENT_RE = re.compile(r'[A-Za-z].*\d+|\d+.*[A-Za-z]')
+_NUMBER_PCT_RE = re.compile(r'\d+\.?\d*%?')
+_ABBREVIATION_RE = re.compile(r'\b[A-Z]{2,}\b')
+_CITATION_RE = re.compile(r'\bet al\.|\(\d{4}\)')
+_STRUCTURED_DATA_RE = re.compile(r'\d+\.?\d*[%]?|\([^)]*\d+[^)]*\)')
+_SHORT_ACRONYM_RE = re.compile(r'\b[A-Z]{2,4}\b')
+_HYPHENATED_RE = re.compile(r'\b[A-Za-z]+-[A-Za-z]+\b')
+_METRIC_WORDS_RE = re.compile(r'\b[a-z]{2,6}\b(?:\s+[a-z]{2,6}\b){1,4}')
+_SUFFIX_TERM_RE = re.compile(r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b')
+
+# Word tokens for column boundaries: a bare number (optionally a
+# percentage), else the start of an acronym, CamelCase or versioned term
+_WORD_TOKEN_RE = re.compile(
+    r'(?P<number>\d+\.?\d*[%]?$)|'
+    r'(?i:[A-Z]{2,6}(?:-\d+)?|[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}|'
+    r'[A-Za-z]+[-_]?\d+(?:\.\d+)*)')
+_YEAR_IN_PARENS_RE = re.compile(r'\(\d{4}\)')
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Column structure analysis
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_NUMERICAL_VALUE_RE = re.compile(
+    r'^(?:\d+'                      # Integer
+    r'|\d+\.\d+'                    # Decimal
+    r'|\d+\.\d+%'                   # Percentage
+    r'|\d+[eE][+-]?\d+'             # Scientific notation
+    r'|\d+\.\d+[eE][+-]?\d+)$')     # Decimal scientific notation
+
+# Content patterns that can define a column, as (pattern, name) pairs
+_COLUMN_CONTENT_PATTERNS = [(re.compile(p, re.IGNORECASE), name) for p, name in (
+    (r'^[A-Za-z][^0-9]*?\bet al\.',
+     'author_reference'),  # Author citations
+    # Years in parentheses
+    (r'\([^)]*\d{4}[^)]*\)', 'year_parentheses'),
+    # Dataset references (algorithmic)
+    (r'\([^)]*(?:dataset|data|corpus|benchmark)[^)]*\)',
+     'dataset_parentheses'),
+    (r'\d+\.?\d*%', 'percentage'),                         # Percentages
+    # Numbers with common units (algorithmic)
+    (r'\d+\.?\d*[MKBGTmkμnpf]?[BWHzsFLVA]?\b', 'numbers_with_units'),
+    # Scientific notation
+    (r'\d+\.?\d*[eE][+-]?\d+', 'scientific_notation'),
+    # Capitalized technical terms (likely model/method names)
+    (r'\b[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}\b', 'technical_terms'),
+    # Acronyms and abbreviations
+    (r'\b[A-Z]{2,6}\b(?:-\d+)?', 'acronyms'),
+    # Version numbers or model variants
+    (r'\b[A-Za-z]+[-_]?\d+(?:\.\d+)*\b', 'versioned_terms'),
+    # Hyphenated technical terms
+    (r'\b[A-Za-z]+(?:-[A-Za-z]+){1,3}\b', 'hyphenated_terms'),
+)]
+
+# Cell patterns for splitting a row by the column content patterns
+_COLUMN_SPLIT_PATTERNS = {name: re.compile(p, re.IGNORECASE) for name, p in {
+    'author_reference': r'[A-Za-z][^,\d]*?\bet al\.?[^,]*',
+    'year_parentheses': r'\([^)]*\d{4}[^)]*\)',
+    'dataset_parentheses': r'\([^)]*(?:dataset|data|corpus|benchmark)[^)]*\)',
+    'percentage': r'\d+\.?\d*\s*%',
+    'numbers_with_units': r'\d+\.?\d*[MKBGTmkμnpf]?[BWHzsFLVA]?\b',
+    'scientific_notation': r'\d+\.?\d*[eE][+-]?\d+',
+    'technical_terms': r'\b[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}\b',
+    'acronyms': r'\b[A-Z]{2,6}\b(?:-\d+)?',
+    'versioned_terms': r'\b[A-Za-z]+[-_]?\d+(?:\.\d+)*\b',
+    'hyphenated_terms': r'\b[A-Za-z]+(?:-[A-Za-z]+){1,3}\b'
+}.items()}
+
+# Table section consolidation
+_TABLE_NUMBER_RE = re.compile(r'table\s+\d+')
+# Method, model/data and parameter words that mark a new table's header
+_CONTINUATION_HEADER_RE = re.compile(
+    r'\b\w*method\w*\b|\b\w*approach\w*\b'
+    r'|\b\w*model\w*\b|\b\w*dat\w*\b'
+    r'|\b\w*param\w*\b|\b\w*flop\w*\b')
+
+# Academic content cues for _calculate_academic_table_confidence, matched
+# on lowered text
+_ACADEMIC_CONFIDENCE_PATTERNS = [re.compile(p) for p in (
+    r'\bet al\.',
+    r'\(\d{4}\)',
+    # Performance-related patterns (algorithmic)
+    # Performance-related suffixes
+    r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b',
+    # Method/data-related patterns (algorithmic)
+    # Dataset/method patterns
+    r'\b\w*dat\w*\b|\b\w*model\w*\b|\b\w*method\w*\b|\b\w*approach\w*\b',
+    r'\d+\.?\d*%',
+    r'\b[A-Z]{2,}\b'  # Abbreviations
+)]
+
+# Header row cues for _looks_like_header_row
+# Primary column header indicators (algorithmic detection)
+_PRIMARY_HEADER_PATTERNS = [re.compile(p) for p in (
+    # Medium-length words (likely descriptive terms)
+    r'\b[a-z]{4,12}\b',
+    r'\b[A-Z]{2,}\s+\d{4}\b',  # Dataset patterns like "ISIC 2017"
+    r'\b[A-Z][a-z]+[A-Z][a-z]*\b',  # CamelCase terms
+    r'\b\w+[-_]\w+\b',  # Hyphenated or underscore terms
+    r'\b[A-Z][a-z]{2,8}\b',  # Capitalized terms
+)]
+# Metric sub-header indicators (short abbreviations, repeated patterns)
+_METRIC_HEADER_PATTERNS = [re.compile(p) for p in (
+    # Repeated short terms like "DSC SE SP ACC"
+    r'\b[a-z]{2,4}\b(?:\s+[a-z]{2,4}\b){2,}',
+    # Repeated caps like "DSC SE SP ACC"
+    r'\b[A-Z]{2,4}\b(?:\s+[A-Z]{2,4}\b){2,}',
+)]
+_DATASET_NAME_RE = re.compile(r'\b[A-Z]{2,}\s+\d{4}\b|\b[A-Z]{2,}\s+\d+\b')
+
+# Running heads and repeated header rows recur on every page, so the pure
+# line classifiers below are memoised on the line text
+_LINE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
+def _match_table_title(line_lower: str) -> Optional[Tuple[str, str]]:
+    """Return the table number and description of a lowered title line."""
+    # Multiple table title patterns to try (in order of preference);
+    # all of them start with "table", "tab." or "tbl", which most lines
+    # lack, so no match can begin before the first "tab" or "tbl"
+    tab_pos = line_lower.find('tab')
+    tbl_pos = line_lower.find('tbl')
+    if tab_pos < 0:
+        if tbl_pos < 0:
+            return None
+        start = tbl_pos
+    elif tbl_pos < 0:
+        start = tab_pos
+    else:
+        start = min(tab_pos, tbl_pos)
+    for pattern in _TABLE_TITLE_PATTERNS:
+        match = pattern.search(line_lower, start)
+        if match:
+            # If only description captured, assign number as '1'
+            if match.lastindex == 1:
+                return '1', match.group(1)
+            return match.group(1), match.group(2)
+    return None
+
+
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
+def _is_table_header_line(line: str) -> bool:
+    """Check if a line looks like a table header even without 'Table' word."""
+    # Must have reasonable length and at least 2 indicators
+    if not 10 <= len(line) <= 200:
+        return False
+
+    # Look for common table header patterns using algorithmic detection
+    line_lower = line.lower()
+    cue_count = _count_header_cues(line_lower)
+    if cue_count is not None:
+        return cue_count >= 2
+
+    indicator_count = 0
+    for pattern in _HEADER_LINE_INDICATORS:
+        if pattern.search(line_lower):
+            indicator_count += 1
+            if indicator_count >= 2:
+                return True
+    return False
+
+
+def _table_row_indicators(line: str, stripped: str):
+    """Yield the table row indicators of a line, cheapest first."""
+    # Method name
+    yield _METHOD_START_RE.match(stripped) is not None
+    # Reasonable word count
+    yield 3 <= len(line.split()) <= 20
+    # Character-class checks skip patterns that cannot match: the numeric
+    # cues need a digit, percentages a '%' and citations a bracket
+    has_digit = _DIGIT_RE.search(line) is not None
+    # Percentages
+    yield (has_digit and '%' in line
+           and _PERCENT_RE.search(line) is not None)
+    # Citations
+    yield (('[' in line or '(' in line)
+           and _BRACKET_OR_YEAR_RE.search(line) is not None)
+    if not has_digit:
+        return
+    # Multiple numbers
+    numbers = _NUMBER_RE.finditer(line)
+    yield next(numbers, None) is not None and next(numbers, None) is not None
+    # Mixed content
+    yield _MIXED_CONTENT_RE.search(line) is not None
+
+
+@lru_cache(maxsize=_LINE_CACHE_SIZE)
+def _is_table_row(line: str) -> bool:
+    """Check if a line looks like a table row."""
+    stripped = line.strip()
+    if len(stripped) < 5:
+        return False
+
+    # A line is likely a table row if it has multiple indicators;
+    # counting stops at the second one
+    indicator_count = 0
+    for has_indicator in _table_row_indicators(line, stripped):
+        if has_indicator:
+            indicator_count += 1
+            if indicator_count >= 2:
+                return True
+    return False
+
+
+def _clean_data_cell(cell: Any) -> str:
+    """Clean a table data cell for markdown output."""
+    # Clean cell content; pipes are blanked along with line breaks, so
+    # there is nothing left to escape
+    cleaned = str(cell).translate(_CELL_BREAK_TRANS).strip()
+
+    # Format numerical values better; a plain decimal has digits on both
+    # sides of its only dot
+    whole, dot, fraction = cleaned.partition('.')
+    if dot and whole.isdecimal() and fraction.isdecimal():
+        try:
+            # Format to reasonable decimal places
+            num_val = float(cleaned)
+            if num_val < 1:
+                return f"{num_val:.3f}"
+            return f"{num_val:.2f}"
+        except ValueError:
+            pass
+    return cleaned
+
+
+def _word_token(word: str) -> Tuple[bool, bool, bool, bool]:
+    """Tokenize a word for column boundary detection.
+
+    Returns whether the word is a number, starts a technical term, starts
+    with an ASCII letter and contains a year in parentheses.
+    """
+    match = _WORD_TOKEN_RE.match(word)
+    is_number = match is not None and match.lastgroup == 'number'
+    return (is_number,
+            match is not None and not is_number,
+            word[:1] in _ASCII_LETTERS,
+            '(' in word and _YEAR_IN_PARENS_RE.search(word) is not None)
+
+
+# Pages handed to one table worker task, to amortize process and open cost
+_TABLE_PAGES_PER_TASK = 10
+
+
+def _get_max_workers(num_tasks: int) -> int:
+    """Pool size for CPU-bound page work: one per task, capped at 8."""
+    return max(1, min(os.cpu_count() or 1, num_tasks, 8))
+
+
+def _table_worker(pdf_path: str, page_nums: List[int],
+                  config) -> Dict[int, List[Dict[str, Any]]]:
+    """Extract tables from a batch of pages inside a worker process."""
+    extractor = TableExtractor(config)
+    results = {}
+    with fitz.open(pdf_path) as doc:
+        for page_num in page_nums:
+            results[page_num] = extractor.extract_tables_from_page(
+                doc[page_num], page_num)
+    return results
+
+
+@dataclass
+class SpanTable:
+    """A page's visible text spans as flat arrays, in page order.
+
+    Span i has text texts[i], bbox bboxes[i] and belongs to line
+    line_ids[i]. Only lines with a visible span are kept; line j has the
+    space-joined text line_texts[j] and bbox line_bboxes[j].
+    """
+    texts: List[str]
+    bboxes: np.ndarray
+    line_ids: np.ndarray
+    line_texts: List[str]
+    line_bboxes: np.ndarray
+
+
+def _build_span_table(blocks: Dict) -> SpanTable:
+    """Collect the visible spans of a get_text("dict") result."""
+    texts = []
+    bboxes = []
+    line_ids = []
+    line_texts = []
+    line_bboxes = []
+
+    for block in blocks.get("blocks", []):
+        for line in block.get("lines", []):
+            line_start = len(texts)
+            for span in line.get("spans", []):
+                text = span.get("text", "")
+                if text.strip():
+                    texts.append(text)
+                    bboxes.append(span.get("bbox", (0, 0, 0, 0)))
+                    line_ids.append(len(line_texts))
+
+            if len(texts) > line_start:
+                line_texts.append(' '.join(texts[line_start:]).strip())
+                line_bboxes.append(line.get("bbox") or bboxes[line_start])
+
+    return SpanTable(texts,
+                     np.array(bboxes, dtype=float).reshape(-1, 4),
+                     np.array(line_ids, dtype=int),
+                     line_texts,
+                     np.array(line_bboxes, dtype=float).reshape(-1, 4))
+
 
 class TableExtractor(BaseExtractor):
     """Advanced table extraction with support for complex layouts and spanning cells."""
@@ -15,26 +492,94 @@ class TableExtractor(BaseExtractor):
         super().__init__(config)
         self.table_strategies = ['bbox_analysis', 'text_alignment', 'hybrid']
         self.min_table_confidence = 0.7
-
-    def extract_tables_from_page(self, page, page_num: int) -> List[Dict[str, Any]]:
-        """Extract tables from a page with enhanced analysis."""
-        if not self.config.get('extract_tables', True):
+        # The configuration is settled before extractors are built
+        self.extract_tables_enabled = config.get('extract_tables', True)
+        # A table at least this confident skips the remaining strategies
+        self.early_exit_confidence = config.get(
+            'table_early_exit_confidence', 0.9)
+
+    @classmethod
+    def extract_tables_from_document(cls, pdf_path, page_nums: Optional[List[int]] = None,
+                                     config=None) -> Dict[int, List[Dict[str, Any]]]:
+        """Extract tables from many pages in parallel, keyed by page number.
+
+        Each worker process opens the PDF itself and handles a batch of
+        pages, so no fitz objects have to cross process boundaries. With
+        threading_mode set to 'none', or when all pages fit in one batch,
+        the pages are handled in this process and no pool is started.
+        There is no thread mode: PyMuPDF is not thread-safe.
+        """
+        extractor = cls(config if config is not None else {})
+        if page_nums is None:
+            with fitz.open(pdf_path) as doc:
+                page_nums = list(range(len(doc)))
+
+        if not extractor.extract_tables_enabled:
+            return {page_num: [] for page_num in page_nums}
+
+        batches = [page_nums[i:i + _TABLE_PAGES_PER_TASK]
+                   for i in range(0, len(page_nums), _TABLE_PAGES_PER_TASK)]
+        results = {}
+
+        if not batches:
+            return results
+
+        if (extractor.config.get('threading_mode', 'process') != 'process' or
+                len(batches) == 1):
+            try:
+                return _table_worker(str(pdf_path), page_nums, extractor.config)
+            except Exception as e:
+                extractor.logger.warning(
+                    f"Table extraction failed for {pdf_path}: {e}")
+                return {page_num: [] for page_num in page_nums}
+
+        with ProcessPoolExecutor(max_workers=_get_max_workers(len(batches))) as pool:
+            futures = [pool.submit(_table_worker, str(pdf_path), batch,
+                                   extractor.config)
+                       for batch in batches]
+            for batch, future in zip(batches, futures):
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    extractor.logger.warning(
+                        f"Table extraction failed for pages {batch[0]}-{batch[-1]}: {e}")
+                    for page_num in batch:
+                        results[page_num] = []
+
+        return results
+
+    def extract_tables_from_page(self, page, page_num: int,
+                                 blocks: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Extract tables from a page with enhanced analysis.
+
+        blocks is the page's get_text("dict") result, if already parsed.
+        """
+        if not self.extract_tables_enabled:
             return []
 
         tables = []
 
         try:
-            # Strategy 1: Bounding box analysis for structured tables
-            bbox_tables = self._extract_bbox_tables(page, page_num)
-            tables.extend(bbox_tables)
-
-            # Strategy 2: Text alignment analysis
-            alignment_tables = self._extract_alignment_tables(page, page_num)
-            tables.extend(alignment_tables)
-
-            # Strategy 3: Look for explicit table markers
-            marker_tables = self._extract_marked_tables(page, page_num)
-            tables.extend(marker_tables)
+            # The bbox and alignment strategies share one walk of the page
+            if blocks is None:
+                blocks = page.get_text("dict")
+            spans = _build_span_table(blocks)
+
+            # Strategies in order of expected precision: bounding box
+            # analysis for structured tables, explicit table markers, then
+            # text alignment analysis
+            strategies = ((self._extract_bbox_tables, (page, page_num, spans)),
+                          (self._extract_marked_tables, (page, page_num)),
+                          (self._extract_alignment_tables, (page, page_num, spans)))
+            early_exit_confidence = self.early_exit_confidence
+            for extract, args in strategies:
+                strategy_tables = extract(*args)
+                tables.extend(strategy_tables)
+                # A confident table means the page is already well served
+                if early_exit_confidence and any(
+                        t['confidence'] >= early_exit_confidence
+                        for t in strategy_tables):
+                    break
 
             # Remove duplicates and low-confidence tables
             tables = self._deduplicate_and_filter_tables(tables)
@@ -63,35 +608,28 @@ class TableExtractor(BaseExtractor):
         markdown_lines.append("")
 
         # Normalize table data and handle varying column counts
-        max_cols = max(len(row) for row in table_data) if table_data else 0
+        row_lengths = [len(row) for row in table_data]
+        max_cols = max(row_lengths)
         if max_cols == 0:
             return ""
 
         # Smart column count detection for academic papers
         # Sometimes the first row is a caption/title, not actual table headers
-        actual_table_start = 0
-        for i, row in enumerate(table_data):
-            if len(row) >= max_cols * 0.7:  # Row has most of the expected columns
-                actual_table_start = i
-                break
+        min_cols = max_cols * 0.7  # Row has most of the expected columns
+        actual_table_start = next(
+            (i for i, length in enumerate(row_lengths) if length >= min_cols), 0)
 
-        # Use the detected table start
+        # Use the detected table start; the widest row always qualifies, so
+        # the column count of the remaining rows is still max_cols
         working_data = table_data[actual_table_start:]
-        if not working_data:
-            working_data = table_data
-
-        # Recalculate max columns based on actual table data
-        max_cols = max(len(row) for row in working_data) if working_data else 0
         if max_cols < 2:  # Need at least 2 columns for a table
             max_cols = 2
 
-        normalized_data = []
-        for row in working_data:
-            normalized_row = list(row)
-            while len(normalized_row) < max_cols:
-                normalized_row.append("")
-            # Truncate if too many columns
-            normalized_data.append(normalized_row[:max_cols])
+        # Pad short rows in one list concatenation; truncate if too many
+        # columns
+        normalized_data = [
+            (list(row) + [""] * (max_cols - len(row)))[:max_cols]
+            for row in working_data]
 
         if not normalized_data:
             return ""
@@ -101,18 +639,8 @@ class TableExtractor(BaseExtractor):
 
         # Use algorithmic patterns instead of hardcoded keywords
         first_row_text = ' '.join(header).lower()
-        header_patterns = [
-            r'\b[a-z]{4,12}\b',  # Medium-length descriptive words
-            # Method/data patterns
-            r'\b\w*dat\w*\b|\b\w*model\w*\b|\b\w*method\w*\b|\b\w*approach\w*\b',
-            # Performance-related suffixes
-            r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b',
-            r'\b[A-Z]{2,}\s+\d{4}\b',  # Dataset patterns like "ISIC 2017"
-            r'\b\w+[-_]\w+\b',  # Hyphenated or underscore terms
-        ]
-
         has_header_patterns = any(
-            re.search(pattern, first_row_text) for pattern in header_patterns)
+            pattern.search(first_row_text) for pattern in _HEADER_ROW_PATTERNS)
 
         if not any(h.strip() for h in header) or not has_header_patterns:
             # Generate descriptive column headers based on content
@@ -124,7 +652,7 @@ class TableExtractor(BaseExtractor):
         # Clean header cells
         clean_header = []
         for i, cell in enumerate(header):
-            cleaned = re.sub(r'[|\n\r]', ' ', str(cell)).strip()
+            cleaned = str(cell).translate(_CELL_BREAK_TRANS).strip()
             if not cleaned:
                 cleaned = f"Column {i+1}"
             # Capitalize first letter for better formatting
@@ -139,41 +667,17 @@ class TableExtractor(BaseExtractor):
         separators = []
         for i, header_cell in enumerate(clean_header):
             # Check if this column contains mostly numbers (right-align)
-            column_values = [row[i] if i < len(
-                row) else "" for row in data_rows]
-            column_text = ' '.join(column_values)
-
-            if self.detect_numerical_patterns(column_text):
+            if self._column_is_numeric(data_rows, i):
                 separators.append("---:")  # Right align for numbers
             else:
                 separators.append("---")   # Left align for text
 
         markdown_lines.append("| " + " | ".join(separators) + " |")
 
-        # Add data rows with enhanced formatting
+        # Add data rows with enhanced formatting, one string per row
+        append = markdown_lines.append
         for row in data_rows:
-            clean_row = []
-            for i, cell in enumerate(row):
-                # Clean cell content
-                cleaned = re.sub(r'[|\n\r]', ' ', str(cell)).strip()
-                # Escape any remaining pipes
-                cleaned = cleaned.replace('|', '\\|')
-
-                # Format numerical values better
-                if re.search(r'^\d+\.\d+$', cleaned):
-                    try:
-                        # Format to reasonable decimal places
-                        num_val = float(cleaned)
-                        if num_val < 1:
-                            cleaned = f"{num_val:.3f}"
-                        else:
-                            cleaned = f"{num_val:.2f}"
-                    except ValueError:
-                        pass
-
-                clean_row.append(cleaned)
-
-            markdown_lines.append("| " + " | ".join(clean_row) + " |")
+            append("| " + " | ".join(map(_clean_data_cell, row)) + " |")
 
         markdown_lines.append("")  # Add spacing after table
 
@@ -183,12 +687,16 @@ class TableExtractor(BaseExtractor):
         """Generate smart column headers based on table content."""
         headers = []
 
+        # Strip every cell once and transpose, so each column's non-empty
+        # values come from a single pass over the rows
+        columns = [[value for value in column if value]
+                   for column in zip_longest(
+                       *[[cell.strip() for cell in row] for row in table_data],
+                       fillvalue='')]
+
         # Analyze each column to determine appropriate header
         for col_idx in range(max_cols):
-            column_values = []
-            for row in table_data:
-                if col_idx < len(row) and row[col_idx].strip():
-                    column_values.append(row[col_idx].strip())
+            column_values = columns[col_idx] if col_idx < len(columns) else []
 
             if not column_values:
                 headers.append(f"Column {col_idx + 1}")
@@ -199,29 +707,29 @@ class TableExtractor(BaseExtractor):
 
             # Check for common academic paper patterns using algorithmic detection
             if col_idx == 0:
-                if any(re.search(r'\(.*\d{4}.*\)', val) for val in column_values):
+                if any(_CITATION_YEAR_RE.search(val) for val in column_values):
                     headers.append("Reference")
-                elif any(re.search(r'\b[A-Za-z]+(?:[-_][A-ZaZ]+)*\b', val) for val in column_values):
+                elif any(_METHOD_NAME_RE.search(val) for val in column_values):
                     headers.append("Method")
                 else:
                     headers.append("Approach")
             elif self.detect_numerical_patterns(column_text):
                 # Numerical column - determine type using algorithmic patterns
-                if re.search(r'\d+\.?\d*%|\b\w*acc\w*\b|\b\w*prec\w*\b', column_text):
+                if _ACCURACY_RE.search(column_text):
                     headers.append("Accuracy")
-                elif re.search(r'\b\w*loss\w*\b|\b\w*err\w*\b', column_text):
+                elif _LOSS_RE.search(column_text):
                     headers.append("Loss")
-                elif re.search(r'\b\w*time\w*\b|\b\w*speed\w*\b|\bms\b|\bs\b', column_text):
+                elif _TIME_RE.search(column_text):
                     headers.append("Time")
                 else:
                     headers.append("Metric")
             else:
                 # Text column using algorithmic patterns
-                if re.search(r'\b\w*dat\w*\b|\b\w*corp\w*\b|\b\w*bench\w*\b', column_text):
+                if _DATASET_RE.search(column_text):
                     headers.append("Dataset")
-                elif re.search(r'\b\w*arch\w*\b|\b\w*net\w*\b|\b\w*model\w*\b', column_text):
+                elif _ARCHITECTURE_RE.search(column_text):
                     headers.append("Architecture")
-                elif re.search(r'\b\w*type\w*\b|\b\w*class\w*\b|\b\w*categ\w*\b', column_text):
+                elif _TYPE_RE.search(column_text):
                     headers.append("Type")
                 else:
                     headers.append(f"Column {col_idx + 1}")
@@ -230,34 +738,43 @@ class TableExtractor(BaseExtractor):
 
     def detect_numerical_patterns(self, text: str) -> bool:
         """Detect if text contains numerical data typical of ML results."""
-        # Look for patterns common in ML papers
-        patterns = [
-            r'\d+\.\d+%',  # Percentages
-            r'\d+\.\d+±\d+\.\d+',  # Mean ± std
-            r'\d+\.\d+\s*[±]\s*\d+\.\d+',  # Mean ± std (with spaces)
-            r'\d+\.\d{2,4}',  # Decimal numbers (accuracy, loss, etc.)
-            r'\d+[,]\d+',  # Large numbers with commas
-            r'\b\d+[kKmM]\b',  # Numbers with k/M suffixes
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, text):
-                return True
+        return _search_numeric(text) is not None
+
+    def _column_is_numeric(self, rows: List[List[str]], col_idx: int) -> bool:
+        """detect_numerical_patterns on a column's values joined by spaces.
+
+        Values are searched one at a time, stopping at the first hit; only
+        a spaced "±" can match across two values, so the column is only
+        collected and joined when one is present.
+        """
+        has_plus_minus = False
+        for row in rows:
+            if col_idx < len(row):
+                value = row[col_idx]
+                if _search_numeric(value):
+                    return True
+                if '±' in value:
+                    has_plus_minus = True
+        if has_plus_minus:
+            return self.detect_numerical_patterns(' '.join(
+                [row[col_idx] if col_idx < len(row) else "" for row in rows]))
         return False
 
     # Helper methods for advanced table extraction
-    def _extract_bbox_tables(self, page, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_bbox_tables(self, page, page_num: int,
+                             spans: Optional[SpanTable] = None) -> List[Dict[str, Any]]:
         """Extract tables using bounding box analysis for grid-like structures."""
         tables = []
 
         try:
-            blocks = page.get_text("dict")
+            if spans is None:
+                spans = _build_span_table(page.get_text("dict"))
 
-            # Group blocks by their spatial relationships
-            table_regions = self._identify_grid_regions(blocks, page.rect)
+            # Group spans by their spatial relationships
+            table_regions = self._identify_grid_regions(spans, page.rect)
 
             for region_idx, region in enumerate(table_regions):
-                table_data = self._analyze_grid_structure(region)
+                table_data = self._analyze_grid_structure(region, spans)
                 if table_data and self._validate_table_structure(table_data):
                     tables.append({
                         'type': 'bbox_grid',
@@ -265,7 +782,7 @@ class TableExtractor(BaseExtractor):
                         'region_id': region_idx,
                         'data': table_data,
                         'confidence': self._calculate_table_confidence(table_data),
-                        'bbox': self._get_region_bbox(region)
+                        'bbox': self._get_region_bbox(region, spans)
                     })
 
         except Exception as e:
@@ -274,12 +791,13 @@ class TableExtractor(BaseExtractor):
 
         return tables
 
-    def _extract_alignment_tables(self, page, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_alignment_tables(self, page, page_num: int,
+                                  spans: Optional[SpanTable] = None) -> List[Dict[str, Any]]:
         """Extract tables using text alignment analysis."""
         tables = []
 
         try:
-            text_lines = self._get_structured_text_lines(page)
+            text_lines = self._get_structured_text_lines(page, spans)
             table_regions = self._find_aligned_text_regions(text_lines)
 
             for region_idx, region in enumerate(table_regions):
@@ -290,7 +808,8 @@ class TableExtractor(BaseExtractor):
                         'page': page_num,
                         'region_id': region_idx,
                         'data': table_data,
-                        'confidence': self._calculate_alignment_confidence(region),
+                        'confidence': self._calculate_alignment_confidence(
+                            region, table_data),
                         'bbox': self._get_text_region_bbox(region)
                     })
 
@@ -364,130 +883,33 @@ class TableExtractor(BaseExtractor):
 
         return tables
 
-    def _detect_table_title(self, line_lower: str, original_line: str) -> re.Match:
-        """Robust table title detection with multiple patterns."""
-        # Multiple table title patterns to try (in order of preference)
-        patterns = [
-            # Standard formats
-            # Table 1. Title
-            r'table\s+(\d+)\.?\s*(.*)',
-            # Table 1 - Title or Table 1: Title
-            r'table\s+(\d+)\s*[-:]\s*(.*)',
-            # Table 1 . Title
-            r'table\s+(\d+)\s*\.\s*(.*)',
-            # Table 1 Title (no punctuation)
-            r'table\s+(\d+)\s+(.*)',
-
-            # Roman numerals
-            # Table I. Title
-            r'table\s+([ivxlc]+)\.?\s*(.*)',
-            # Table I - Title
-            r'table\s+([ivxlc]+)\s*[-:]\s*(.*)',
-
-            # Letter designations
-            # Table A. Title
-            r'table\s+([a-z])\.?\s*(.*)',
-            # Table A - Title
-            r'table\s+([a-z])\s*[-:]\s*(.*)',
-
-            # Alternative formats
-            # Table1. Title (no space)
-            r'table\s*(\d+)\.?\s*(.*)',
-            # Tab. 1. Title
-            r'tab\.\s*(\d+)\.?\s*(.*)',
-            # Tbl. 1. Title
-            r'tbl\.?\s*(\d+)\.?\s*(.*)',
-
-            # Multi-word variations
-            # Table 1. Multi-sentence title.
-            r'table\s+(\d+)\.\s*([^.]+\..*)',
-            # Table 1 – Title (various dashes)
-            r'table\s+(\d+)\s*[\-–—]\s*(.*)',
-
-            # Parenthetical numbering
-            # Table (1) Title
-            r'table\s*\((\d+)\)\s*(.*)',
-            # Table [1] Title
-            r'table\s*\[(\d+)\]\s*(.*)',
-
-            # No number (fallback)
-            # Table - Title or Table: Title
-            r'table\s*[-:]\s*(.*)',
-            # Table Title (last resort)
-            r'table\s+(.*)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, line_lower, re.IGNORECASE)
-            if match:
-                # For patterns without explicit number capture, assign a default
-                if len(match.groups()) == 1:
-                    # Create a mock match object with number and description
-                    class MockMatch:
-                        def __init__(self, groups):
-                            self.groups_list = groups
-
-                        def group(self, n):
-                            return self.groups_list[n-1] if n <= len(self.groups_list) else ''
-
-                        def groups(self):
-                            return tuple(self.groups_list)
-
-                    # If only description captured, assign number as '1'
-                    return MockMatch(['1', match.group(1)])
-                else:
-                    return match
+    def _detect_table_title(self, line_lower: str, original_line: str) -> Optional[Tuple[str, str]]:
+        """Robust table title detection with multiple patterns.
+
+        Returns the table number and description, or None.
+        """
+        title = _match_table_title(line_lower)
+        if title:
+            return title
 
         # Additional check for lines that might be table headers without explicit "Table" word
         # but have table-like structure
         if self._looks_like_table_header_line(original_line):
-            class MockMatch:
-                def __init__(self, groups):
-                    self.groups_list = groups
-
-                def group(self, n):
-                    return self.groups_list[n-1] if n <= len(self.groups_list) else ''
-
-                def groups(self):
-                    return tuple(self.groups_list)
-
-            return MockMatch(['1', original_line.strip()])
+            return '1', original_line.strip()
 
         return None
 
     def _looks_like_table_header_line(self, line: str) -> bool:
         """Check if a line looks like a table header even without 'Table' word."""
-        # Look for common table header patterns using algorithmic detection
-        header_indicators = [
-            # Performance metrics (algorithmic pattern for metric-like terms)
-            # Performance-related suffixes
-            r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b',
-            # Method/approach terms (algorithmic pattern)
-            # Hyphenated or underscore technical terms
-            r'\b[A-Za-z]+(?:[-_][A-Za-z]+)*\b',
-            # Data-related terms (algorithmic pattern)
-            r'\b\w*dat\w*\b|\b\w*corp\w*\b|\b\w*bench\w*\b',  # Data/corpus/benchmark patterns
-            # Result/metric terms (algorithmic pattern)
-            r'\b\w*result\w*\b|\b\w*perform\w*\b|\b\w*score\w*\b|\b\w*metric\w*\b',  # Result patterns
-            # Parameter terms (algorithmic pattern)
-            r'\b\w*param\w*\b|\b\w*flop\w*\b',  # Parameter patterns
-            # Multiple capital letters (likely abbreviations)
-            r'\b[A-Z]{2,}\b.*\b[A-Z]{2,}\b',
-            # Numeric patterns suggesting column headers
-            r'\d+\s+\d+\s+\d+',
-        ]
-
-        line_lower = line.lower()
-        indicator_count = sum(1 for pattern in header_indicators
-                              if re.search(pattern, line_lower, re.IGNORECASE))
-
-        # Must have at least 2 indicators and reasonable length
-        return indicator_count >= 2 and 10 <= len(line) <= 200
+        return _is_table_header_line(line)
 
     def _find_complete_table_sections(self, lines: List[str]) -> List[Dict[str, Any]]:
         """Find complete table sections including titles, headers, and data with enhanced detection."""
         sections = []
         current_section = None
+        # Per-line classifiers, bound once outside the scan
+        detect_table_title = self._detect_table_title
+        looks_like_table_content = self._looks_like_table_content
 
         i = 0
         while i < len(lines):
@@ -495,9 +917,9 @@ class TableExtractor(BaseExtractor):
             line_lower = line.lower()
 
             # Check for table title patterns with multiple robust patterns
-            table_title_match = self._detect_table_title(line_lower, line)
+            table_title = detect_table_title(line_lower, line)
 
-            if table_title_match:
+            if table_title:
                 # Save previous section
                 if current_section and len(current_section.get('content_lines', [])) >= 2:
                     sections.append(current_section)
@@ -505,8 +927,8 @@ class TableExtractor(BaseExtractor):
                 # Start new section
                 current_section = {
                     'title': line,
-                    'table_number': table_title_match.group(1),
-                    'description': table_title_match.group(2).strip(),
+                    'table_number': table_title[0],
+                    'description': table_title[1].strip(),
                     'content_lines': [],
                     'start_line': i
                 }
@@ -516,7 +938,7 @@ class TableExtractor(BaseExtractor):
             # If we're in a table section, collect content
             if current_section is not None:
                 # Check if this line looks like table content
-                if self._looks_like_table_content(line, current_section['content_lines']):
+                if looks_like_table_content(line, current_section['content_lines']):
                     current_section['content_lines'].append(line)
                 else:
                     # End current table section if we hit non-table content
@@ -542,9 +964,10 @@ class TableExtractor(BaseExtractor):
         sections = []
         potential_tables = []
         current_block = []
+        looks_like_table_row = self._looks_like_table_row
 
         for i, line in enumerate(lines):
-            if self._looks_like_table_row(line):
+            if looks_like_table_row(line):
                 current_block.append(line)
             else:
                 if len(current_block) >= 3:  # At least header + 2 data rows
@@ -571,99 +994,80 @@ class TableExtractor(BaseExtractor):
 
     def _looks_like_table_row(self, line: str) -> bool:
         """Check if a line looks like a table row."""
-        if not line.strip() or len(line.strip()) < 5:
-            return False
-
-        # Check for table row indicators
-        indicators = {
-            'has_multiple_numbers': len(re.findall(r'\d+\.?\d*', line)) >= 2,
-            'has_method_name': bool(re.search(r'^[A-Za-z][\w\-]+', line.strip())),
-            'has_citations': bool(re.search(r'\[.*?\]|\(\d{4}\)', line)),
-            'has_percentages': bool(re.search(r'\d+\.?\d*%', line)),
-            'word_count_reasonable': 3 <= len(line.split()) <= 20,
-            'has_mixed_content': bool(re.search(r'[A-Za-z].*\d+|\d+.*[A-Za-z]', line))
-        }
-
-        # A line is likely a table row if it has multiple indicators
-        indicator_count = sum(indicators.values())
-        return indicator_count >= 2
+        return _is_table_row(line)
 
     def _looks_like_table_content(self, line: str, existing_lines: List[str]) -> bool:
         """Determine if a line looks like table content using algorithmic detection."""
         if not line.strip():
             return False
 
-        # Check for various table content indicators
-        features = {
-            'has_numbers': bool(re.search(r'\d+\.?\d*%?', line)),
-            'has_parentheses': '(' in line and ')' in line,
-            'has_commas': ',' in line,
-            'word_count': len(line.split()),
-            'has_abbreviations': bool(re.search(r'\b[A-Z]{2,}\b', line)),
-            'has_citations': bool(re.search(r'\bet al\.|\(\d{4}\)', line)),
-            'has_structured_data': bool(re.search(r'\d+\.?\d*[%]?|\([^)]*\d+[^)]*\)', line)),
-            'line_length': len(line)
-        }
+        words = line.split()
+        word_count = len(words)
 
         # If this is the first content line, be permissive
         if not existing_lines:
-            return features['word_count'] >= 2
-
-        # Academic table content patterns - be more permissive
-        academic_content_indicators = [
-            features['has_numbers'],
-            features['has_abbreviations'],
-            features['has_citations'],
-            features['has_structured_data'],
-            # Repeated patterns (like "DSC SE SP ACC DSC SE SP ACC")
-            len(set(line.split())) < len(
-                line.split()) * 0.7,  # 70% unique words
-            # Technical terms and acronyms common in academic tables
-            # Acronyms like DSC, SE, SP, ACC
-            bool(re.search(r'\b[A-Z]{2,4}\b', line)),
-            # Method names and citations
-            # Hyphenated terms
-            bool(re.search(r'\b[A-Za-z]+-[A-Za-z]+\b', line)),
-            # Metric-like patterns (algorithmic detection)
-            # Sequences of short lowercase words (metrics)
-            bool(
-                re.search(r'\b[a-z]{2,6}\b(?:\s+[a-z]{2,6}\b){1,4}', line.lower())),
-            # Performance-related patterns (without hardcoding specific terms)
-            # Performance-related suffixes
-            bool(re.search(r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b', line.lower())),
-            # Mathematical/statistical indicators
-            # Variables with numbers (F1, R2, etc.)
-            bool(re.search(r'\b[a-z]\d+\b|\b\w+[-_]?\d+\b', line.lower())),
-        ]
+            return word_count >= 2
+
+        # Academic table content patterns - be more permissive. The number
+        # and structured-data indicators both match any digit, so a line
+        # with a digit always has two of them
+        if _NUMBER_PCT_RE.search(line):
+            return True
+
+        has_abbreviations = _ABBREVIATION_RE.search(line) is not None
+        has_citations = (('et al.' in line or '(' in line)
+                         and _CITATION_RE.search(line) is not None)
 
         # If it has multiple academic indicators, accept it
-        if sum(academic_content_indicators) >= 2:
+        indicator_count = has_abbreviations + has_citations
+        if indicator_count >= 2:
             return True
+        for has_indicator in self._academic_content_indicators(line, words):
+            if has_indicator:
+                indicator_count += 1
+                if indicator_count >= 2:
+                    return True
 
         # Calculate similarity with existing table lines
-        if existing_lines:
-            avg_word_count = sum(len(l.split())
-                                 for l in existing_lines) / len(existing_lines)
-            word_count_similarity = abs(
-                features['word_count'] - avg_word_count) <= 6  # More tolerant
-
-            has_similar_patterns = any([
-                features['has_numbers'] and any(
-                    re.search(r'\d+\.?\d*%?', l) for l in existing_lines),
-                features['has_parentheses'] and any(
-                    '(' in l for l in existing_lines),
-                features['has_citations'] and any(
-                    re.search(r'\bet al\.|\(\d{4}\)', l) for l in existing_lines),
-                features['has_structured_data'] and any(
-                    re.search(r'\d+\.?\d*[%]?|\([^)]*\d+[^)]*\)', l) for l in existing_lines),
-                # Similar abbreviation patterns
-                features['has_abbreviations'] and any(
-                    re.search(r'\b[A-Z]{2,4}\b', l) for l in existing_lines)
-            ])
+        avg_word_count = sum(len(l.split())
+                             for l in existing_lines) / len(existing_lines)
+        if abs(word_count - avg_word_count) <= 6:  # More tolerant
+            return True
 
-            return word_count_similarity or has_similar_patterns
+        # Similar patterns; lines with numbers were accepted above
+        has_parens = '(' in line and ')' in line
+        if not (has_parens or has_citations or has_abbreviations):
+            return False
 
-        return True
+        # Search the existing lines once, joined by newlines so that \b and
+        # the single-line patterns still stop at line boundaries
+        existing_text = '\n'.join(existing_lines)
+        return ((has_parens and '(' in existing_text) or
+                (has_citations and
+                 _CITATION_RE.search(existing_text) is not None) or
+                # Similar abbreviation patterns
+                (has_abbreviations and
+                 _SHORT_ACRONYM_RE.search(existing_text) is not None))
+
+    def _academic_content_indicators(self, line: str, words: List[str]):
+        """Yield the remaining academic table content indicators of a line."""
+        # Repeated patterns (like "DSC SE SP ACC DSC SE SP ACC")
+        yield len(set(words)) < len(words) * 0.7  # 70% unique words
+        # Technical terms and acronyms common in academic tables
+        # Acronyms like DSC, SE, SP, ACC
+        yield _SHORT_ACRONYM_RE.search(line) is not None
+        # Method names and citations
+        # Hyphenated terms
+        yield _HYPHENATED_RE.search(line) is not None
+        line_lower = line.lower()
+        # Metric-like patterns (algorithmic detection)
+        # Sequences of short lowercase words (metrics)
+        yield _METRIC_WORDS_RE.search(line_lower) is not None
+        # Performance-related patterns (without hardcoding specific terms)
+        # Performance-related suffixes
+        yield _SUFFIX_TERM_RE.search(line_lower) is not None
+        # Variables with numbers (F1, R2, etc.) would need a digit, and
+        # lines with digits are accepted before these indicators are asked
 
     def _parse_academic_table_section(self, section: Dict[str, Any]) -> Optional[List[List[str]]]:
         """Parse an academic table section into structured data."""
@@ -831,7 +1235,7 @@ class TableExtractor(BaseExtractor):
 
             # Find positions of 2+ consecutive spaces
             gap_positions = []
-            for match in re.finditer(r'\s{2,}', line):
+            for match in _MULTI_SPACE_RE.finditer(line):
                 start_pos = match.start()
                 end_pos = match.end()
                 # Use the middle of the gap as the separator position
@@ -911,41 +1315,18 @@ class TableExtractor(BaseExtractor):
         """Find columns based on content patterns."""
         patterns = []
 
-        # Look for common academic table patterns using algorithmic detection
-        academic_patterns = [
-            (r'^[A-Za-z][^0-9]*?\bet al\.',
-             'author_reference'),  # Author citations
-            # Years in parentheses
-            (r'\([^)]*\d{4}[^)]*\)', 'year_parentheses'),
-            # Dataset references (algorithmic)
-            (r'\([^)]*(?:dataset|data|corpus|benchmark)[^)]*\)',
-             'dataset_parentheses'),
-            (r'\d+\.?\d*%', 'percentage'),                         # Percentages
-            # Numbers with common units (algorithmic)
-            (r'\d+\.?\d*[MKBGTmkμnpf]?[BWHzsFLVA]?\b', 'numbers_with_units'),
-            # Scientific notation
-            (r'\d+\.?\d*[eE][+-]?\d+', 'scientific_notation'),
-            # Capitalized technical terms (likely model/method names)
-            (r'\b[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}\b', 'technical_terms'),
-            # Acronyms and abbreviations
-            (r'\b[A-Z]{2,6}\b(?:-\d+)?', 'acronyms'),
-            # Version numbers or model variants
-            (r'\b[A-Za-z]+[-_]?\d+(?:\.\d+)*\b', 'versioned_terms'),
-            # Hyphenated technical terms
-            (r'\b[A-Za-z]+(?:-[A-Za-z]+){1,3}\b', 'hyphenated_terms'),
-        ]
-
         # Analyze which patterns appear in which positions across lines
+        # using common academic table patterns
         pattern_positions = {pattern_name: []
-                             for _, pattern_name in academic_patterns}
+                             for _, pattern_name in _COLUMN_CONTENT_PATTERNS}
 
         for line in lines:
             line_patterns = {}
-            for pattern, pattern_name in academic_patterns:
-                matches = list(re.finditer(pattern, line, re.IGNORECASE))
-                if matches:
+            for pattern, pattern_name in _COLUMN_CONTENT_PATTERNS:
+                match = pattern.search(line)
+                if match:
                     # Record the position of the first match
-                    line_patterns[pattern_name] = matches[0].start()
+                    line_patterns[pattern_name] = match.start()
 
             for pattern_name, pos in line_patterns.items():
                 pattern_positions[pattern_name].append(pos)
@@ -1126,19 +1507,7 @@ class TableExtractor(BaseExtractor):
         cleaned = word.strip('[]()%,')
 
         # Check various numerical patterns
-        patterns = [
-            r'^\d+$',                    # Integer
-            r'^\d+\.\d+$',              # Decimal
-            r'^\d+\.\d+%$',             # Percentage
-            r'^\d+[eE][+-]?\d+$',       # Scientific notation
-            r'^\d+\.\d+[eE][+-]?\d+$',  # Decimal scientific notation
-        ]
-
-        for pattern in patterns:
-            if re.match(pattern, cleaned):
-                return True
-
-        return False
+        return _NUMERICAL_VALUE_RE.match(cleaned) is not None
 
     def _parse_table_row_with_structure(self, line: str, structure: Dict[str, Any]) -> List[str]:
         """Parse a table row using the determined column structure."""
@@ -1213,19 +1582,55 @@ class TableExtractor(BaseExtractor):
 
     def _deduplicate_and_filter_tables(self, tables: List[Dict]) -> List[Dict]:
         """Remove duplicate tables and filter by confidence."""
-        return [t for t in tables if t['confidence'] >= self.min_table_confidence]
-
-    def _get_region_bbox(self, region: List[List[Dict]]) -> Tuple[float, float, float, float]:
+        # The strategies often detect the same physical table; detections
+        # with identical cell content are treated as one, keeping the most
+        # confident
+        best = {}
+        for table in tables:
+            if table['confidence'] < self.min_table_confidence:
+                continue
+            signature = tuple(map(tuple, table['data']))
+            kept = best.get(signature)
+            if kept is None or table['confidence'] > kept['confidence']:
+                best[signature] = table
+        return list(best.values())
+
+    def _get_region_bbox(self, region: List[np.ndarray],
+                         spans: SpanTable) -> Tuple[float, float, float, float]:
         """Get bounding box for an entire region."""
-        return (0, 0, 0, 0)  # Simplified for modularity
+        if not region:
+            return (0, 0, 0, 0)
+        return self._union_bbox(spans.bboxes[np.concatenate(region)])
 
     def _get_text_region_bbox(self, region: List[Dict]) -> Tuple[float, float, float, float]:
         """Get bounding box for a text region."""
-        return (0, 0, 0, 0)  # Simplified for modularity
+        return self._union_bbox(np.array(
+            [line['bbox'] for line in region], dtype=float).reshape(-1, 4))
 
     def _get_grid_bbox(self, grid_structure: Dict) -> Tuple[float, float, float, float]:
         """Get bounding box for a grid structure."""
-        return (0, 0, 0, 0)  # Simplified for modularity
+        lines = (grid_structure.get('horizontal_lines', []) +
+                 grid_structure.get('vertical_lines', []))
+        if not lines:
+            return (0, 0, 0, 0)
+
+        # Either endpoint of a ruling line may be the leftmost or topmost
+        coords = np.array([(line['start'][0], line['start'][1],
+                            line['end'][0], line['end'][1]) for line in lines],
+                          dtype=float)
+        xs = coords[:, 0::2]
+        ys = coords[:, 1::2]
+        return (xs.min().item(), ys.min().item(),
+                xs.max().item(), ys.max().item())
+
+    def _union_bbox(self, bboxes: np.ndarray) -> Tuple[float, float, float, float]:
+        """Smallest box enclosing the rows of an (N, 4) bbox array."""
+        if not len(bboxes):
+            return (0, 0, 0, 0)
+
+        x0, y0 = bboxes[:, :2].min(axis=0).tolist()
+        x1, y1 = bboxes[:, 2:].max(axis=0).tolist()
+        return (x0, y0, x1, y1)
 
     def _consolidate_related_table_sections(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Consolidate table sections that should be one unified table."""
@@ -1251,7 +1656,7 @@ class TableExtractor(BaseExtractor):
                 current_title = current_group.get('title', '').lower()
 
                 # Check for continuation patterns
-                if (not re.search(r'table\s+\d+', title) or  # No new table number
+                if (not _TABLE_NUMBER_RE.search(title) or  # No new table number
                     self._similar_table_structure(current_group['content_lines'], content_lines) or
                         self._likely_table_continuation(current_group['content_lines'], content_lines)):
                     should_merge = True
@@ -1287,8 +1692,8 @@ class TableExtractor(BaseExtractor):
             words1 = len(line1.split())
             words2 = len(line2.split())
 
-            nums1 = len(re.findall(r'\d+\.?\d*', line1))
-            nums2 = len(re.findall(r'\d+\.?\d*', line2))
+            nums1 = len(_NUMBER_RE.findall(line1))
+            nums2 = len(_NUMBER_RE.findall(line2))
 
             # Similar structure if word counts and numeric patterns are close
             if abs(words1 - words2) <= 3 and abs(nums1 - nums2) <= 2:
@@ -1307,17 +1712,12 @@ class TableExtractor(BaseExtractor):
 
         # If it starts with a method name or contains many numbers, likely continuation
         has_method_pattern = bool(
-            re.search(r'^[A-Za-z][\w\-]+', first_curr_line))
-        has_many_numbers = len(re.findall(r'\d+\.?\d*', first_curr_line)) >= 3
+            _METHOD_START_RE.match(first_curr_line))
+        has_many_numbers = len(_NUMBER_RE.findall(first_curr_line)) >= 3
 
         # Check if it doesn't look like a header using algorithmic patterns
-        header_patterns = [
-            r'\b\w*method\w*\b|\b\w*approach\w*\b',  # Method patterns
-            r'\b\w*model\w*\b|\b\w*dat\w*\b',  # Model/data patterns
-            r'\b\w*param\w*\b|\b\w*flop\w*\b',  # Parameter patterns
-        ]
-        looks_like_header = any(re.search(pattern, first_curr_line.lower())
-                                for pattern in header_patterns)
+        looks_like_header = bool(
+            _CONTINUATION_HEADER_RE.search(first_curr_line.lower()))
 
         return (has_method_pattern or has_many_numbers) and not looks_like_header
 
@@ -1347,7 +1747,7 @@ class TableExtractor(BaseExtractor):
         numeric_score = 0
         for row in table_data:
             for cell in row:
-                if re.search(r'\d+\.?\d*', cell):
+                if _NUMBER_RE.search(cell):
                     numeric_score += 1
 
         numeric_ratio = numeric_score / total_cells if total_cells > 0 else 0
@@ -1357,21 +1757,8 @@ class TableExtractor(BaseExtractor):
         academic_score = 0
         all_text = ' '.join(' '.join(row) for row in table_data).lower()
 
-        academic_patterns = [
-            r'\bet al\.',
-            r'\(\d{4}\)',
-            # Performance-related patterns (algorithmic)
-            # Performance-related suffixes
-            r'\b\w+(?:ness|ity|ance|ence|acy|ion)\b',
-            # Method/data-related patterns (algorithmic)
-            # Dataset/method patterns
-            r'\b\w*dat\w*\b|\b\w*model\w*\b|\b\w*method\w*\b|\b\w*approach\w*\b',
-            r'\d+\.?\d*%',
-            r'\b[A-Z]{2,}\b'  # Abbreviations
-        ]
-
-        for pattern in academic_patterns:
-            if re.search(pattern, all_text):
+        for pattern in _ACADEMIC_CONFIDENCE_PATTERNS:
+            if pattern.search(all_text):
                 academic_score += 0.15
 
         confidence_factors.append(min(academic_score, 1.0))
@@ -1452,31 +1839,17 @@ class TableExtractor(BaseExtractor):
         # Sort patterns by their average position
         sorted_patterns = sorted(patterns, key=lambda x: x['avg_position'])
 
-        # Define regex patterns for each pattern type (algorithmic and flexible)
-        pattern_regexes = {
-            'author_reference': r'[A-Za-z][^,\d]*?\bet al\.?[^,]*',
-            'year_parentheses': r'\([^)]*\d{4}[^)]*\)',
-            'dataset_parentheses': r'\([^)]*(?:dataset|data|corpus|benchmark)[^)]*\)',
-            'percentage': r'\d+\.?\d*\s*%',
-            'numbers_with_units': r'\d+\.?\d*[MKBGTmkμnpf]?[BWHzsFLVA]?\b',
-            'scientific_notation': r'\d+\.?\d*[eE][+-]?\d+',
-            'technical_terms': r'\b[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}\b',
-            'acronyms': r'\b[A-Z]{2,6}\b(?:-\d+)?',
-            'versioned_terms': r'\b[A-Za-z]+[-_]?\d+(?:\.\d+)*\b',
-            'hyphenated_terms': r'\b[A-Za-z]+(?:-[A-Za-z]+){1,3}\b'
-        }
-
         last_end = 0
 
         for pattern_info in sorted_patterns:
             pattern_name = pattern_info['name']
-            pattern_regex = pattern_regexes.get(pattern_name, '')
+            pattern_regex = _COLUMN_SPLIT_PATTERNS.get(pattern_name)
 
             if pattern_regex:
                 # Search from where we left off
                 search_text = remaining[last_end:] if last_end < len(
                     remaining) else ""
-                match = re.search(pattern_regex, search_text, re.IGNORECASE)
+                match = pattern_regex.search(search_text)
 
                 if match:
                     # Calculate absolute position in the remaining string
@@ -1511,7 +1884,7 @@ class TableExtractor(BaseExtractor):
                            for col in line.split('\t') if col.strip()]
             elif '  ' in line:  # Two or more spaces
                 columns = [col.strip()
-                           for col in re.split(r'\s{2,}', line) if col.strip()]
+                           for col in _MULTI_SPACE_RE.split(line) if col.strip()]
             else:
                 # Last resort: split into reasonable chunks
                 words = line.split()
@@ -1540,25 +1913,29 @@ class TableExtractor(BaseExtractor):
         # Smart distribution based on content patterns
         columns = []
 
-        # Identify potential column boundaries based on content patterns
+        # Identify potential column boundaries based on content patterns;
+        # each rule compares a word with the next, so every word is
+        # tokenized once instead of once per side of a pair
+        tokens = [_word_token(word) for word in words]
         boundaries = []
 
-        for i, word in enumerate(words[:-1]):
+        for i, (word, token) in enumerate(zip(words, tokens[:-1])):
             next_word = words[i + 1]
+            is_number, is_term, _, has_year = token
+            _, next_is_term, next_starts_alpha, next_has_year = tokens[i + 1]
 
             # Boundary indicators:
             # 1. Number followed by text
-            if re.match(r'^\d+\.?\d*[%]?$', word) and re.match(r'^[A-Za-z]', next_word):
+            if is_number and next_starts_alpha:
                 boundaries.append(i + 1)
             # 2. Citation pattern (author et al.) followed by different content
             elif 'et al.' in word and not 'et al.' in next_word:
                 boundaries.append(i + 1)
             # 3. Year in parentheses followed by different content
-            elif re.search(r'\(\d{4}\)', word) and not re.search(r'\(\d{4}\)', next_word):
+            elif has_year and not next_has_year:
                 boundaries.append(i + 1)
             # 4. Technical terms (acronyms, CamelCase, versioned) followed by different type
-            elif (re.match(r'^(?:[A-Z]{2,6}(?:-\d+)?|[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}|[A-Za-z]+[-_]?\d+(?:\.\d+)*)', word, re.IGNORECASE)
-                  and not re.match(r'^(?:[A-Z]{2,6}(?:-\d+)?|[A-Z][a-zA-Z]*(?:[A-Z][a-zA-Z]*){1,3}|[A-Za-z]+[-_]?\d+(?:\.\d+)*)', next_word, re.IGNORECASE)):
+            elif is_term and not next_is_term:
                 boundaries.append(i + 1)
 
         # If we found good boundaries, use them
@@ -1623,36 +2000,16 @@ class TableExtractor(BaseExtractor):
         """Check if a line looks like a table header."""
         line_lower = line.lower()
 
-        # Use algorithmic patterns instead of hardcoded terms
-        # Primary column header indicators (algorithmic detection)
-        primary_patterns = [
-            # Medium-length words (likely descriptive terms)
-            r'\b[a-z]{4,12}\b',
-            r'\b[A-Z]{2,}\s+\d{4}\b',  # Dataset patterns like "ISIC 2017"
-            r'\b[A-Z][a-z]+[A-Z][a-z]*\b',  # CamelCase terms
-            r'\b\w+[-_]\w+\b',  # Hyphenated or underscore terms
-            r'\b[A-Z][a-z]{2,8}\b',  # Capitalized terms
-        ]
-
-        # Metric sub-header indicators (short abbreviations, repeated patterns)
-        metric_patterns = [
-            # Repeated short terms like "DSC SE SP ACC"
-            r'\b[a-z]{2,4}\b(?:\s+[a-z]{2,4}\b){2,}',
-            # Repeated caps like "DSC SE SP ACC"
-            r'\b[A-Z]{2,4}\b(?:\s+[A-Z]{2,4}\b){2,}',
-        ]
-
         words = line_lower.split()
 
         # Count matches using algorithmic patterns
-        primary_matches = sum(1 for pattern in primary_patterns
-                              if re.search(pattern, line))
-        metric_matches = sum(1 for pattern in metric_patterns
-                             if re.search(pattern, line))
+        primary_matches = sum(1 for pattern in _PRIMARY_HEADER_PATTERNS
+                              if pattern.search(line))
+        metric_matches = sum(1 for pattern in _METRIC_HEADER_PATTERNS
+                             if pattern.search(line))
 
         # Check for dataset/year patterns (like "ISIC 2017", "MNIST", etc.)
-        has_dataset_pattern = bool(
-            re.search(r'\b[A-Z]{2,}\s+\d{4}\b|\b[A-Z]{2,}\s+\d+\b', line))
+        has_dataset_pattern = bool(_DATASET_NAME_RE.search(line))
 
         # Check for repeated patterns (sub-headers often repeat metrics)
         unique_words = set(words)
@@ -1681,47 +2038,38 @@ class TableExtractor(BaseExtractor):
         return is_primary_header or is_traditional_header
 
     # Missing helper methods for PDF-based table extraction
-    def _identify_grid_regions(self, blocks: Dict, page_rect) -> List[List[Dict]]:
-        """Identify potential grid regions from PDF blocks."""
-        # Simplified implementation - group blocks by approximate rows and columns
+    def _identify_grid_regions(self, spans: SpanTable, page_rect) -> List[List[np.ndarray]]:
+        """Identify potential grid regions from a page's visible spans.
+
+        Each region is a list of rows, each row an array of span indices.
+        """
+        # Simplified implementation - group spans by approximate rows and columns
         regions = []
 
-        # Extract text blocks
-        text_blocks = []
-        if "blocks" in blocks:
-            for block in blocks["blocks"]:
-                if "lines" in block:
-                    for line in block["lines"]:
-                        if "spans" in line:
-                            for span in line["spans"]:
-                                if span.get("text", "").strip():
-                                    text_blocks.append({
-                                        'text': span["text"],
-                                        'bbox': span.get("bbox", [0, 0, 0, 0]),
-                                        'x': span.get("bbox", [0, 0, 0, 0])[0],
-                                        'y': span.get("bbox", [0, 0, 0, 0])[1]
-                                    })
-
-        # Group blocks into potential table regions
-        if text_blocks:
-            # Sort by y-coordinate (top to bottom)
-            text_blocks.sort(key=lambda b: b['y'])
-
-            # Group into rows based on y-coordinate proximity
+        # Group spans into potential table regions
+        if spans.texts:
+            # Sort by y-coordinate (top to bottom), stable like list.sort
+            order = np.argsort(spans.bboxes[:, 1], kind='stable')
+            ys = spans.bboxes[order, 1]
+
+            # Group into rows based on y-coordinate proximity: a row runs
+            # while spans stay within tolerance of its first span, so
+            # each row end is a binary search instead of a per-span test
             tolerance = 10  # pixels
             rows = []
-            current_row = [text_blocks[0]] if text_blocks else []
-
-            for block in text_blocks[1:]:
-                if abs(block['y'] - current_row[0]['y']) <= tolerance:
-                    current_row.append(block)
-                else:
-                    if len(current_row) > 1:  # Only consider rows with multiple elements
-                        rows.append(current_row)
-                    current_row = [block]
-
-            if len(current_row) > 1:
-                rows.append(current_row)
+            count = len(ys)
+            start = 0
+            while start < count:
+                row_y = ys[start]
+                end = int(np.searchsorted(ys, row_y + tolerance, side='right'))
+                # Settle rounding at the boundary with the y - row_y test
+                while end < count and ys[end] - row_y <= tolerance:
+                    end += 1
+                while end > start + 1 and ys[end - 1] - row_y > tolerance:
+                    end -= 1
+                if end - start > 1:  # Only consider rows with multiple elements
+                    rows.append(order[start:end])
+                start = end
 
             # If we have multiple rows that look tabular, consider it a region
             if len(rows) >= 2:
@@ -1729,17 +2077,17 @@ class TableExtractor(BaseExtractor):
 
         return regions
 
-    def _analyze_grid_structure(self, region: List[List[Dict]]) -> List[List[str]]:
+    def _analyze_grid_structure(self, region: List[np.ndarray],
+                                spans: SpanTable) -> List[List[str]]:
         """Analyze grid structure to extract table data."""
         table_data = []
+        texts = spans.texts
 
         for row in region:
-            # Sort row elements by x-coordinate (left to right)
-            row.sort(key=lambda b: b['x'])
-            row_data = [block['text'].strip()
-                        for block in row if block['text'].strip()]
-            if row_data:
-                table_data.append(row_data)
+            # Sort row elements by x-coordinate (left to right); the span
+            # table only holds spans with visible text
+            row = row[np.argsort(spans.bboxes[row, 0], kind='stable')]
+            table_data.append([texts[i].strip() for i in row])
 
         return table_data
 
@@ -1748,14 +2096,29 @@ class TableExtractor(BaseExtractor):
         if not table_data or len(table_data) < 2:
             return False
 
-        # Check if rows have reasonably consistent column counts
+        # A table without a single cell has nothing to validate
         col_counts = [len(row) for row in table_data]
-        avg_cols = sum(col_counts) / len(col_counts)
-        consistent_rows = sum(
-            1 for count in col_counts if abs(count - avg_cols) <= 2)
+        total_cells = sum(col_counts)
+        if not total_cells:
+            return False
 
-        # 70% of rows should be consistent
-        return consistent_rows >= len(table_data) * 0.7
+        # Check if rows have reasonably consistent column counts; 70% of
+        # rows should be, so stop once the outcome is settled either way
+        avg_cols = total_cells / len(col_counts)
+        required = len(table_data) * 0.7
+        allowed_misses = len(table_data) - required
+        consistent_rows = misses = 0
+        for count in col_counts:
+            if abs(count - avg_cols) <= 2:
+                consistent_rows += 1
+                if consistent_rows >= required:
+                    return True
+            else:
+                misses += 1
+                if misses > allowed_misses:
+                    return False
+
+        return consistent_rows >= required
 
     def _calculate_table_confidence(self, table_data: List[List[str]]) -> float:
         """Calculate confidence score for extracted table."""
@@ -1781,39 +2144,28 @@ class TableExtractor(BaseExtractor):
 
         # Factor 3: Numerical content (common in tables)
         numeric_content = sum(1 for row in table_data for cell in row
-                              if re.search(r'\d+\.?\d*', cell))
+                              if _NUMBER_RE.search(cell))
         numeric_ratio = numeric_content / total_cells if total_cells > 0 else 0
         factors.append(min(numeric_ratio * 2, 1.0))  # Cap at 1.0
 
         return sum(factors) / len(factors) if factors else 0.5
 
-    def _get_structured_text_lines(self, page) -> List[Dict]:
+    def _get_structured_text_lines(self, page, spans: Optional[SpanTable] = None) -> List[Dict]:
         """Extract structured text lines from page."""
         lines = []
 
         try:
-            blocks = page.get_text("dict")
-            if "blocks" in blocks:
-                for block in blocks["blocks"]:
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            line_text = ""
-                            line_bbox = None
-
-                            if "spans" in line:
-                                for span in line["spans"]:
-                                    if span.get("text", "").strip():
-                                        line_text += span["text"] + " "
-                                        if line_bbox is None:
-                                            line_bbox = span.get(
-                                                "bbox", [0, 0, 0, 0])
-
-                            if line_text.strip():
-                                lines.append({
-                                    'text': line_text.strip(),
-                                    'bbox': line_bbox or [0, 0, 0, 0],
-                                    'y': line_bbox[1] if line_bbox else 0
-                                })
+            if spans is None:
+                spans = _build_span_table(page.get_text("dict"))
+
+            # The row's y comes from the line's first visible span; the
+            # bbox covers the whole line
+            first_spans = np.flatnonzero(np.diff(spans.line_ids, prepend=-1))
+            line_ys = spans.bboxes[first_spans, 1].tolist()
+            lines = [{'text': text, 'bbox': tuple(bbox), 'y': y}
+                     for text, bbox, y in zip(spans.line_texts,
+                                              spans.line_bboxes.tolist(),
+                                              line_ys)]
         except Exception as e:
             self.logger.warning(
                 f"Failed to extract structured text lines: {e}")
@@ -1871,46 +2223,49 @@ class TableExtractor(BaseExtractor):
                     row_data = [cell.strip()
                                 for cell in text.split('\t') if cell.strip()]
                 else:
-                    row_data = [cell.strip() for cell in re.split(
-                        r'\s{2,}', text) if cell.strip()]
+                    row_data = [cell.strip() for cell in
+                                _MULTI_SPACE_RE.split(text) if cell.strip()]
 
                 if row_data:
                     table_data.append(row_data)
 
         return table_data
 
-    def _calculate_alignment_confidence(self, region: List[Dict]) -> float:
-        """Calculate confidence for aligned text region."""
+    def _calculate_alignment_confidence(self, region: List[Dict],
+                                        table_data: Optional[List[List[str]]] = None) -> float:
+        """Calculate confidence for aligned text region.
+
+        table_data is the region's _parse_aligned_table result, if already
+        parsed.
+        """
         if not region:
             return 0.0
 
         # Simple confidence based on consistency of content
-        table_data = self._parse_aligned_table(region)
+        if table_data is None:
+            table_data = self._parse_aligned_table(region)
         return self._calculate_table_confidence(table_data)
 
     def _extract_table_lines(self, drawings: List) -> List[Dict]:
         """Extract lines that might form table borders."""
-        lines = []
-
-        # Look for horizontal and vertical lines in drawings
-        for drawing in drawings:
-            if drawing.get('type') == 'l':  # Line
-                start = drawing.get('start', [0, 0])
-                end = drawing.get('end', [0, 0])
-
-                # Determine if horizontal or vertical
-                is_horizontal = abs(start[1] - end[1]) < 5
-                is_vertical = abs(start[0] - end[0]) < 5
-
-                if is_horizontal or is_vertical:
-                    lines.append({
-                        'start': start,
-                        'end': end,
-                        'horizontal': is_horizontal,
-                        'vertical': is_vertical
-                    })
+        # Line segments are the 'l' items of each drawing's path
+        segments = [(item[1], item[2]) for drawing in drawings
+                    for item in drawing.get('items', ()) if item[0] == 'l']
+        if not segments:
+            return []
 
-        return lines
+        # Determine if horizontal or vertical for all segments at once
+        coords = np.array([(start[0], start[1], end[0], end[1])
+                           for start, end in segments], dtype=float)
+        is_horizontal = np.abs(coords[:, 1] - coords[:, 3]) < 5
+        is_vertical = np.abs(coords[:, 0] - coords[:, 2]) < 5
+
+        return [{
+            'start': segments[i][0],
+            'end': segments[i][1],
+            'horizontal': bool(is_horizontal[i]),
+            'vertical': bool(is_vertical[i])
+        } for i in np.flatnonzero(is_horizontal | is_vertical)]
 
     def _build_grid_from_lines(self, lines: List[Dict]) -> Optional[Dict]:
         """Build grid structure from detected lines."""
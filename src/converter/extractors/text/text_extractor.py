@@ -2,12 +2,43 @@
 
 import re
 import logging
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import fitz
 
 from ..base import BaseExtractor
 
+# Pre-compiled text patterns
+# Only the block pattern has a '.' that must cross lines
+_MATH_BLOCK_RE = re.compile(
+    r'\\begin\{([^}]+)\}(.*?)\\end\{\1\}', re.DOTALL)
+_MATH_INLINE_RE = re.compile(r'\$([^$]+)\$')
+# Greek letters (Α-Ω, α-ω) and math symbols, each wrapped as inline math
+_MATH_TRANS = str.maketrans({
+    ch: f'${ch}$' for ch in (
+        [chr(cp) for cp in range(0x391, 0x3AA)] +
+        [chr(cp) for cp in range(0x3B1, 0x3CA)] +
+        list('∑∏∫∂∇±×÷≤≥≠≈∞'))
+})
+
+# Numbered sections, ALL CAPS, Title Case, subsection numbering and
+# common section names, matched in a single pass
+_HEADING_COMBINED = re.compile(
+    r'^(?:\d+\.?\s+[A-Z]'
+    r'|[A-Z][A-Z\s]+$'
+    r'|[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$'
+    r'|\d+\.\d+'
+    r'|Abstract$|Introduction$|Conclusion$|References$)')
+
+
+@dataclass
+class PageAnalysis:
+    """Paragraphs and column layout of a page, gathered in one span sweep."""
+    paragraphs: List[str]
+    is_multicol: bool
+
 
 class TextExtractor(BaseExtractor):
     """Extract and process text content from PDF pages."""
@@ -20,7 +51,14 @@ class TextExtractor(BaseExtractor):
 
     def analyze_document_structure(self, doc):
         """Analyze the document to identify heading patterns."""
-        font_sizes = {}
+        # Only the distinct (size, flags) keys matter, so count them
+        # rather than keeping every text sample
+        font_counts = Counter()
+
+        # Stop early once the largest fonts stop changing between checks
+        check_interval = self.config.get('structure_check_interval', 10)
+        previous_top = None
+        stable_rounds = 0
 
         for page_num in range(len(doc)):
             page = doc[page_num]
@@ -30,45 +68,48 @@ class TextExtractor(BaseExtractor):
                 if "lines" in block:
                     for line in block["lines"]:
                         for span in line["spans"]:
-                            font_size = span["size"]
-                            font_flags = span["flags"]
                             text = span["text"].strip()
 
                             if text and len(text) > 3:
-                                key = (font_size, font_flags)
-                                if key not in font_sizes:
-                                    font_sizes[key] = []
-                                font_sizes[key].append(text)
+                                font_counts[(span["size"], span["flags"])] += 1
+
+            if check_interval and (page_num + 1) % check_interval == 0:
+                top_fonts = sorted(
+                    font_counts, key=lambda x: x[0], reverse=True)[:6]
+                if top_fonts == previous_top:
+                    stable_rounds += 1
+                    if stable_rounds >= 2:
+                        break
+                else:
+                    stable_rounds = 0
+                previous_top = top_fonts
 
         # Sort font sizes to determine hierarchy
         sorted_fonts = sorted(
-            font_sizes.keys(), key=lambda x: x[0], reverse=True)
+            font_counts, key=lambda x: x[0], reverse=True)
         self.font_hierarchy = {font: i+1 for i,
                                font in enumerate(sorted_fonts[:6])}
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove hyphenation at line breaks
-        text = re.sub(r'-\s+', '', text)
-        return text.strip()
+        text = ' '.join(text.split())
+        # Remove hyphenation at line breaks; a trailing hyphen is kept
+        return text.replace('- ', '')
 
     def handle_mathematical_content(self, text: str) -> str:
         """Preserve mathematical notation and formulas."""
         # Detect LaTeX-like math expressions
         math_patterns = [
-            (r'\$([^$]+)\$', r'$\1$'),  # Inline math
-            (r'\\begin\{([^}]+)\}(.*?)\\end\{\1\}',
-             r'```math\n\2\n```'),  # Block math
-            (r'([α-ωΑ-Ω])', r'$\1$'),  # Greek letters
-            (r'([∑∏∫∂∇±×÷≤≥≠≈∞])', r'$\1$'),  # Math symbols
+            (_MATH_BLOCK_RE, r'```math\n\2\n```'),  # Block math
+            (_MATH_INLINE_RE, r'$\1$'),  # Inline math
         ]
 
         for pattern, replacement in math_patterns:
-            text = re.sub(pattern, replacement, text, flags=re.DOTALL)
+            text = pattern.sub(replacement, text)
 
-        return text
+        # Greek letters and math symbols
+        return text.translate(_MATH_TRANS)
 
     def is_likely_heading(self, text: str, font_info: Tuple[float, int]) -> bool:
         """Determine if text is likely a heading."""
@@ -76,19 +117,7 @@ class TextExtractor(BaseExtractor):
             return False
 
         # Check for common heading patterns
-        heading_patterns = [
-            r'^\d+\.?\s+[A-Z]',  # Numbered sections
-            r'^[A-Z][A-Z\s]+$',  # ALL CAPS
-            r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',  # Title Case
-            r'^\d+\.\d+',  # Subsection numbering
-            r'^Abstract$|^Introduction$|^Conclusion$|^References$',  # Common sections
-        ]
-
-        for pattern in heading_patterns:
-            if re.match(pattern, text):
-                return True
-
-        return False
+        return bool(_HEADING_COMBINED.match(text))
 
     def determine_heading_level(self, font_info: Tuple[float, int]) -> Optional[int]:
         """Determine heading level based on font characteristics."""
@@ -106,7 +135,7 @@ class TextExtractor(BaseExtractor):
             for block in blocks["blocks"]:
                 if "lines" in block:
                     for line in block["lines"]:
-                        line_text = ""
+                        line_parts = []
                         for span in line["spans"]:
                             text = span["text"]
                             font_size = span["size"]
@@ -126,10 +155,10 @@ class TextExtractor(BaseExtractor):
                                     if heading_level and heading_level <= 6:
                                         text = f"{'#' * heading_level} {text}"
 
-                                line_text += text + " "
+                                line_parts.append(text)
 
-                        if line_text.strip():
-                            content.append(line_text.strip())
+                        if line_parts:
+                            content.append(" ".join(line_parts))
 
         except Exception as e:
             self.logger.error(f"Error extracting text: {e}")
@@ -146,14 +175,13 @@ class TextExtractor(BaseExtractor):
 
             for block in text_blocks:
                 if "lines" in block:
-                    block_text = ""
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            text = span["text"].strip()
-                            if text:
-                                block_text += text + " "
+                    block_text = " ".join(
+                        text for line in block["lines"]
+                        for text in (span["text"].strip()
+                                     for span in line["spans"])
+                        if text)
 
-                    if block_text.strip():
+                    if block_text:
                         # Clean the text
                         block_text = self.clean_text(block_text)
                         block_text = self.handle_mathematical_content(
@@ -179,83 +207,70 @@ class TextExtractor(BaseExtractor):
     def handle_multi_column_text(self, page, blocks: Dict) -> List[str]:
         """Handle multi-column text layout detection and processing."""
         try:
-            # Detect if page has multi-column layout
-            if not self._detect_multi_column_layout(blocks):
-                # Single column - use regular processing
-                return self._extract_single_column_text(blocks)
-
-            # Multi-column processing
-            return self._extract_multi_column_text(blocks)
+            return self.process_page(page, blocks).paragraphs
 
         except Exception as e:
             self.logger.warning(f"Multi-column text handling failed: {e}")
             # Fallback to simple text extraction
             return [page.get_text()]
 
-    def _detect_multi_column_layout(self, blocks: Dict) -> bool:
-        """Detect if the page has a multi-column layout."""
-        try:
-            # Get text blocks with their positions
-            text_blocks = []
-            for block in blocks.get("blocks", []):
-                if "lines" in block and block["lines"]:
-                    bbox = block["bbox"]
-                    text = self._extract_block_text(block)
-                    if text.strip():
-                        text_blocks.append({
-                            'text': text,
-                            'bbox': bbox,
-                            'x_center': (bbox[0] + bbox[2]) / 2
-                        })
-
-            if len(text_blocks) < 4:
-                return False
-
-            # Group blocks by their x-center positions
-            x_positions = [block['x_center'] for block in text_blocks]
-            x_positions.sort()
-
-            # Look for distinct column boundaries
-            gaps = []
-            for i in range(1, len(x_positions)):
-                gap = x_positions[i] - x_positions[i-1]
-                if gap > 50:  # Significant gap suggests column boundary
-                    gaps.append(gap)
-
-            # If we have large gaps, likely multi-column
-            return len(gaps) >= 1 and max(gaps) > 100
+    def process_page(self, page, blocks: Optional[Dict] = None) -> PageAnalysis:
+        """Read a page's paragraphs and column layout in a single sweep.
 
-        except Exception:
-            return False
+        Each block's visible span text is joined once; the x-centers of the
+        blocks that have any decide the layout, and the paragraphs are
+        built from the joined texts in column or page order.
+        """
+        if blocks is None:
+            blocks = page.get_text("dict")
 
-    def _extract_single_column_text(self, blocks: Dict) -> List[str]:
-        """Extract text from single-column layout."""
+        # (block, joined visible span text) for every block with lines
+        block_texts = []
+        x_centers = []
+        for block in blocks.get("blocks", []):
+            if "lines" in block:
+                block_text = " ".join(
+                    text for line in block["lines"]
+                    for text in (span["text"].strip()
+                                 for span in line["spans"])
+                    if text)
+                block_texts.append((block, block_text))
+                if block_text:
+                    x_centers.append((block["bbox"][0] + block["bbox"][2]) / 2)
+
+        # A large gap between neighbouring centers is a column boundary
+        x_centers.sort()
+        is_multicol = len(x_centers) >= 4 and any(
+            right - left > 100 for left, right in zip(x_centers, x_centers[1:]))
+
+        if not is_multicol:
+            # Single column - use regular processing
+            paragraphs = self._build_paragraphs(
+                text for _, text in block_texts)
+        else:
+            paragraphs = self._extract_multi_column_text(blocks, block_texts)
+
+        return PageAnalysis(paragraphs, is_multicol)
+
+    def _build_paragraphs(self, block_texts) -> List[str]:
+        """Join block texts in reading order into paragraphs."""
         paragraphs = []
         current_paragraph = []
 
         try:
-            for block in blocks.get("blocks", []):
-                if "lines" in block:
-                    block_text = ""
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            text = span["text"].strip()
-                            if text:
-                                block_text += text + " "
-
-                    if block_text.strip():
-                        # Clean the text
-                        block_text = self.clean_text(block_text)
-                        block_text = self.handle_mathematical_content(
-                            block_text)
-
-                        # Check if this starts a new paragraph
-                        if block_text.endswith('.') or len(current_paragraph) == 0:
-                            current_paragraph.append(block_text)
-                            paragraphs.append(' '.join(current_paragraph))
-                            current_paragraph = []
-                        else:
-                            current_paragraph.append(block_text)
+            for block_text in block_texts:
+                if block_text:
+                    # Clean the text
+                    block_text = self.clean_text(block_text)
+                    block_text = self.handle_mathematical_content(block_text)
+
+                    # Check if this starts a new paragraph
+                    if block_text.endswith('.') or len(current_paragraph) == 0:
+                        current_paragraph.append(block_text)
+                        paragraphs.append(' '.join(current_paragraph))
+                        current_paragraph = []
+                    else:
+                        current_paragraph.append(block_text)
 
             # Add any remaining content
             if current_paragraph:
@@ -266,26 +281,26 @@ class TextExtractor(BaseExtractor):
 
         return paragraphs
 
-    def _extract_multi_column_text(self, blocks: Dict) -> List[str]:
+    def _extract_multi_column_text(self, blocks: Dict,
+                                   block_texts: List[Tuple[Dict, str]]) -> List[str]:
         """Extract text from multi-column layout."""
         try:
             # Group blocks by columns first
             columns = self._group_blocks_by_columns(blocks)
+            text_of = {id(block): text for block, text in block_texts}
 
             all_paragraphs = []
 
             # Process each column
             for column_blocks in columns:
-                column_dict = {"blocks": column_blocks}
-                column_paragraphs = self._extract_single_column_text(
-                    column_dict)
-                all_paragraphs.extend(column_paragraphs)
+                all_paragraphs.extend(self._build_paragraphs(
+                    text_of.get(id(block), "") for block in column_blocks))
 
             return all_paragraphs
 
         except Exception as e:
             self.logger.error(f"Error extracting multi-column text: {e}")
-            return self._extract_single_column_text(blocks)
+            return self._build_paragraphs(text for _, text in block_texts)
 
     def _group_blocks_by_columns(self, blocks: Dict) -> List[List[Dict]]:
         """Group text blocks by their column positions."""
@@ -348,11 +363,9 @@ class TextExtractor(BaseExtractor):
 
     def _extract_block_text(self, block: Dict) -> str:
         """Extract text from a single block."""
-        text = ""
         try:
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    text += span.get("text", "") + " "
+            return " ".join(
+                span.get("text", "") for line in block.get("lines", [])
+                for span in line.get("spans", [])).strip()
         except Exception:
-            pass
-        return text.strip()
+            return ""
@@ -4,6 +4,7 @@ import os
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
@@ -18,6 +19,13 @@ class BibliographicEnricher:
     def __init__(self, config=None):
         self.config = config or {}
         self.session = requests.Session()
+
+        # Pool connections so lookups for successive papers reuse the
+        # same TCP/TLS connections to each metadata API
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         self.session.headers.update({
             'User-Agent': 'PDF-to-Markdown Converter (mailto:research@example.com)'
         })